@@ -5,11 +5,17 @@ Refactored to use dependency injection and proper separation of concerns.
 import os
 import argparse
 import logging
+from functools import cached_property
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
 
 from src.services.text_extractor import TextExtractor
 from src.services.url_extractor import URLExtractor
 from src.services.file_extractor import FileExtractor
 from src.repositories.json_graph_repository import JsonGraphRepository
+from src.repositories.sqlite_extraction_cache import SqliteExtractionCache
 from src.core.config import app_settings
 from src.utils.logging_config import setup_logging
 
@@ -21,23 +27,66 @@ logger = logging.getLogger(__name__)
 class GraphExtractionCLI:
     """CLI for knowledge graph extraction operations."""
     
-    def __init__(self):
-        """Initialize extractors and repository with dependency injection."""
-        self.text_extractor = TextExtractor()
-        self.url_extractor = URLExtractor(text_extractor=self.text_extractor)
-        self.file_extractor = FileExtractor(text_extractor=self.text_extractor)
+    def __init__(self, max_workers: int = app_settings.DEFAULT_MAX_WORKERS, use_cache: bool = False):
+        """
+        Initialize the repository with dependency injection.
+        The HTTP session and extractors are created on first use, so commands like
+        --merge never open a connection pool or load the LLM config.
+        
+        Args:
+            max_workers: Number of concurrent URL workers; sizes the shared HTTP connection pool
+            use_cache: Reuse LLM responses for identical texts from the SQLite extraction cache
+        """
+        self.max_workers = max(1, max_workers)
+        self.use_cache = use_cache
         self.repository = JsonGraphRepository()
     
+    @cached_property
+    def session(self) -> requests.Session:
+        """HTTP session for the URL extractor, created only by URL commands."""
+        return self._create_session(self.max_workers)
+    
+    @cached_property
+    def text_extractor(self) -> TextExtractor:
+        """Text extractor, shared by the URL and file extractors."""
+        cache = None
+        if self.use_cache:
+            cache = SqliteExtractionCache(
+                app_settings.DEFAULT_EXTRACTION_CACHE_PATH,
+                max_entries=app_settings.DEFAULT_EXTRACTION_CACHE_MAX_ENTRIES
+            )
+        return TextExtractor(cache=cache)
+    
+    @cached_property
+    def url_extractor(self) -> URLExtractor:
+        """URL extractor using the shared HTTP session."""
+        return URLExtractor(
+            text_extractor=self.text_extractor,
+            session=self.session,
+            pool_maxsize=self.max_workers
+        )
+    
+    @cached_property
+    def file_extractor(self) -> FileExtractor:
+        """File extractor using the shared text extractor."""
+        return FileExtractor(text_extractor=self.text_extractor)
+    
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        """Create one HTTP session, shared across all URLs, with a pool sized to the workers."""
+        return URLExtractor.create_session(pool_connections=pool_size, pool_maxsize=pool_size)
+    
     def extract_from_text(self, text: str) -> None:
         """Extract and display graph from text."""
         logger.info("Extracting graph from text...")
         
         try:
             graph = self.text_extractor.extract(text)
-            stats = graph.get_stats()
-            logger.info(f"Extraction complete: {stats['num_nodes']} nodes, {stats['num_edges']} edges")
-            logger.info(f"Node types: {stats['node_types']}")
-            logger.info(f"Edge types: {stats['edge_types']}")
+            if logger.isEnabledFor(logging.INFO):
+                stats = graph.get_stats()
+                logger.info(f"Extraction complete: {stats['num_nodes']} nodes, {stats['num_edges']} edges")
+                logger.info(f"Node types: {stats['node_types']}")
+                logger.info(f"Edge types: {stats['edge_types']}")
         except Exception as e:
             logger.error(f"Extraction failed: {e}")
             raise
@@ -47,40 +96,51 @@ class GraphExtractionCLI:
         logger.info(f"Extracting graph from URL: {url}")
         
         try:
-            # Extract text and save it
-            text_path = self.url_extractor.extract_and_save_text(url, output_dir)
-            
-            # Extract graph
-            graph = self.url_extractor.extract(url)
+            # Fetch the page once, save its text and extract the graph
+            text_path, graph = self.url_extractor.extract_and_save(url, output_dir)
             
             # Save graph
             filename = os.path.basename(text_path).replace(".txt", "_graph.json")
             json_path = os.path.join(output_dir, filename)
             self.repository.save(graph, json_path)
             
-            stats = graph.get_stats()
-            logger.info(f"Extraction complete: {stats['num_nodes']} nodes, {stats['num_edges']} edges")
+            logger.info(f"Extraction complete: {len(graph.nodes)} nodes, {len(graph.edges)} edges")
             
         except Exception as e:
             logger.error(f"Extraction from URL failed: {e}")
             raise
     
-    def extract_from_url_list(self, file_path: str, output_dir: str) -> None:
-        """Extract graphs from a list of URLs in a file."""
+    def _safe_extract_from_url(self, url: str, output_dir: str, idx: int, total: int) -> None:
+        """Extract graph from URL, logging failures instead of raising."""
+        logger.info(f"Processing URL {idx}/{total}: {url}")
+        try:
+            self.extract_from_url(url, output_dir)
+        except Exception as e:
+            logger.error(f"Failed to extract from URL {url}: {e}")
+    
+    def extract_from_url_list(
+        self,
+        file_path: str,
+        output_dir: str,
+        max_workers: Optional[int] = None
+    ) -> None:
+        """Extract graphs from a list of URLs in a file, processing URLs concurrently."""
         logger.info(f"Extracting graphs from URL list: {file_path}")
         
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 urls = [line.strip() for line in f if line.strip()]
             
-            logger.info(f"Found {len(urls)} URLs to process")
+            max_workers = max(1, max_workers or self.max_workers)
+            logger.info(f"Found {len(urls)} URLs to process with {max_workers} workers")
+            
+            # Create the extractors once before workers race to initialize them
+            self.url_extractor
             
-            for idx, url in enumerate(urls, start=1):
-                logger.info(f"Processing URL {idx}/{len(urls)}: {url}")
-                try:
-                    self.extract_from_url(url, output_dir)
-                except Exception as e:
-                    logger.error(f"Failed to extract from URL {url}: {e}")
+            # Extraction is network-bound (HTTP fetch + LLM call), so threads overlap the waits
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for idx, url in enumerate(urls, start=1):
+                    executor.submit(self._safe_extract_from_url, url, output_dir, idx, len(urls))
             
             logger.info("All URLs processed")
             
@@ -94,11 +154,12 @@ class GraphExtractionCLI:
         
         try:
             # Find all graph JSON files
-            json_files = [
-                os.path.join(input_dir, f) 
-                for f in os.listdir(input_dir) 
-                if f.endswith("_graph.json")
-            ]
+            with os.scandir(input_dir) as entries:
+                json_files = [
+                    entry.path
+                    for entry in entries
+                    if entry.name.endswith("_graph.json") and entry.is_file()
+                ]
             
             if not json_files:
                 logger.warning(f"No graph JSON files found in {input_dir}")
@@ -106,17 +167,16 @@ class GraphExtractionCLI:
             
             logger.info(f"Found {len(json_files)} graph files to merge")
             
-            # Load and merge all graphs
-            merged_graph = self.repository.load_and_merge_multiple(json_files)
+            # Load and merge all graphs; *_graph.json files are written by this CLI
+            merged_graph = self.repository.load_and_merge_multiple(json_files, trusted=True)
             
             if merged_graph:
                 # Save merged graph
                 os.makedirs(os.path.dirname(output_path), exist_ok=True)
                 self.repository.save(merged_graph, output_path)
                 
-                stats = merged_graph.get_stats()
                 logger.info(f"Merged graph saved to {output_path}")
-                logger.info(f"Total: {stats['num_nodes']} nodes, {stats['num_edges']} edges")
+                logger.info(f"Total: {len(merged_graph.nodes)} nodes, {len(merged_graph.edges)} edges")
             else:
                 logger.error("Failed to merge graphs")
                 
@@ -163,6 +223,17 @@ def main():
         default=os.path.join(app_settings.DEFAULT_MERGED_DIR, "merged_graphs.json"),
         help="Output path for merged graph"
     )
+    parser.add_argument(
+        "--max_workers",
+        type=int,
+        default=app_settings.DEFAULT_MAX_WORKERS,
+        help=f"Number of URLs to process concurrently with --url_list_file (default: {app_settings.DEFAULT_MAX_WORKERS})"
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse LLM responses for identical texts (cache: {app_settings.DEFAULT_EXTRACTION_CACHE_PATH})"
+    )
     parser.add_argument(
         "--log_level",
         type=str,
@@ -177,7 +248,7 @@ def main():
     setup_logging(level=args.log_level)
     
     # Create CLI instance
-    cli = GraphExtractionCLI()
+    cli = GraphExtractionCLI(max_workers=args.max_workers, use_cache=args.cache)
     
     try:
         if args.text:
@@ -1,9 +1,8 @@
 import os
+import functools
 from dotenv import load_dotenv
 from typing import Optional
 
-load_dotenv()
-
 
 class AppSettings:
     """Application settings and constants."""
@@ -14,9 +13,14 @@ class AppSettings:
     DEFAULT_VISUALIZATION_DIR = "data/visualizations"
     DEFAULT_URLS_DIR = "data/urls"
     
+    # Extraction cache settings
+    DEFAULT_EXTRACTION_CACHE_PATH = "data/cache/extractions.sqlite3"
+    DEFAULT_EXTRACTION_CACHE_MAX_ENTRIES = 10000
+    
     # HTTP settings
     DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
     DEFAULT_REQUEST_TIMEOUT = 30
+    DEFAULT_MAX_WORKERS = 8  # Concurrent URL extractions
     
     # Visualization settings
     DEFAULT_VIZ_HEIGHT = "750px"
@@ -29,12 +33,15 @@ class AppSettings:
     
 
 class Config:
-    """Configuration for OpenAI and LLM settings."""
+    """Configuration for OpenAI and LLM settings, read from the environment and .env."""
     
-    OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
-    LLM_MODEL_NAME_ANALYSIS: str = os.getenv("LLM_MODEL_NAME_ANALYSIS", "gpt-4o-mini")
+    OPENAI_API_KEY: Optional[str]
+    LLM_MODEL_NAME_ANALYSIS: str
 
     def __init__(self):
+        load_dotenv()
+        self.OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+        self.LLM_MODEL_NAME_ANALYSIS = os.getenv("LLM_MODEL_NAME_ANALYSIS", "gpt-4o-mini")
         self._validate_config()
 
     def _validate_config(self):
@@ -44,6 +51,14 @@ class Config:
             raise ValueError("LLM_MODEL_NAME_ANALYSIS is not set in environment variables.")
 
 
+@functools.lru_cache(maxsize=1)
+def get_app_config() -> Config:
+    """
+    Get the LLM configuration, loading and validating it on first use so that
+    commands which never call the LLM do not require OPENAI_API_KEY.
+    """
+    return Config()
+
+
 # Singleton instances
-app_config = Config()
 app_settings = AppSettings()
\ No newline at end of file
@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from collections import Counter
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import List, Optional, Dict, Any, Iterable, Iterator
 
 class GenericNode(BaseModel):
     """
@@ -41,8 +42,21 @@ class GenericNode(BaseModel):
             str: The display name of the node.
         """
         return self.properties.get("name", f"{self.type}_{self.id}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the node to a plain dictionary without pydantic's model_dump walk.
+        The properties dict is shared, not copied.
+
+        Returns:
+            Dict[str, Any]: The node fields as a dictionary.
+        """
+        return {"id": self.id, "type": self.type, "properties": self.properties}
     
     def __hash__(self) -> int:
+        # Deliberately not memoized: str caches its own hash, and reading a
+        # pydantic private attribute (routed through __getattr__) is slower
+        # than hashing self.id directly.
         return hash(self.id)
     
     def __eq__(self, other: object) -> bool:
@@ -89,6 +103,22 @@ class GenericEdge(BaseModel):
         """
         self.properties[key] = value
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the edge to a plain dictionary without pydantic's model_dump walk.
+        The properties dict is shared, not copied.
+
+        Returns:
+            Dict[str, Any]: The edge fields as a dictionary.
+        """
+        return {
+            "source": self.source,
+            "target": self.target,
+            "type": self.type,
+            "properties": self.properties,
+            "directed": self.directed,
+        }
+
 class GenericGraph(BaseModel):
     """
     Represents a graph consisting of GenericNode and GenericEdge instances.
@@ -106,6 +136,78 @@ class GenericGraph(BaseModel):
         description="Optional metadata for the graph"
     )
 
+    # Lookup indexes, maintained by add_node/add_edge
+    _node_index: Dict[str, GenericNode] = PrivateAttr(default_factory=dict)
+    _nodes_by_type_lc: Dict[str, List[GenericNode]] = PrivateAttr(default_factory=dict)
+    _edges_by_type_lc: Dict[str, List[GenericEdge]] = PrivateAttr(default_factory=dict)
+    _out_edges: Dict[str, List[GenericEdge]] = PrivateAttr(default_factory=dict)
+    _in_edges: Dict[str, List[GenericEdge]] = PrivateAttr(default_factory=dict)
+
+    # Modification counter, and stats cached for the current version
+    _version: int = PrivateAttr(default=0)
+    _stats_cache: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """
+        Build the lookup indexes from the initial node and edge lists.
+        """
+        self._rebuild_indexes()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name.startswith('_'):
+            return
+        if name in ('nodes', 'edges'):
+            self.touch()
+        else:
+            self._mark_modified()
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild all lookup indexes from the node and edge lists."""
+        self._node_index = {}
+        self._nodes_by_type_lc = {}
+        self._edges_by_type_lc = {}
+        self._out_edges = {}
+        self._in_edges = {}
+        for node in self.nodes:
+            self._index_node(node)
+        for edge in self.edges:
+            self._index_edge(edge)
+
+    @property
+    def version(self) -> int:
+        """Modification counter, bumped whenever the graph changes."""
+        return self._version
+
+    def touch(self) -> None:
+        """
+        Rebuild the lookup indexes and mark the graph as modified.
+
+        add_node/add_edge and field assignment keep the graph consistent on
+        their own. Call this after changing it any other way: appending to
+        or removing from the nodes/edges lists directly, changing a node's
+        id or type, or editing properties (set_property() included; items
+        do not know which graphs hold them). Costs O(nodes + edges).
+        """
+        self._rebuild_indexes()
+        self._mark_modified()
+
+    def _mark_modified(self) -> None:
+        """Bump the version and drop cached stats; the indexes are left as is."""
+        self._version += 1
+        self._stats_cache = None
+
+    def _index_node(self, node: GenericNode) -> None:
+        """Register a node in the id and type indexes."""
+        self._node_index.setdefault(node.id, node)
+        self._nodes_by_type_lc.setdefault(node.type.lower(), []).append(node)
+
+    def _index_edge(self, edge: GenericEdge) -> None:
+        """Register an edge in the type index and adjacency lists."""
+        self._edges_by_type_lc.setdefault(edge.type.lower(), []).append(edge)
+        self._out_edges.setdefault(edge.source, []).append(edge)
+        self._in_edges.setdefault(edge.target, []).append(edge)
+
     def add_node(self, node: GenericNode) -> None:
         """
         Add a node to the graph.
@@ -113,7 +215,9 @@ class GenericGraph(BaseModel):
         Args:
             node (GenericNode): The node to add.
         """
+        self._index_node(node)
         self.nodes.append(node)
+        self._mark_modified()
 
     def add_edge(self, edge: GenericEdge) -> None:
         """
@@ -122,7 +226,60 @@ class GenericGraph(BaseModel):
         Args:
             edge (GenericEdge): The edge to add.
         """
+        self._index_edge(edge)
         self.edges.append(edge)
+        self._mark_modified()
+
+    def bulk_add_nodes(self, nodes: Iterable[GenericNode]) -> None:
+        """
+        Add many nodes to the graph, bumping the version once.
+
+        Args:
+            nodes (Iterable[GenericNode]): The nodes to add.
+        """
+        nodes = list(nodes)
+        for node in nodes:
+            self._index_node(node)
+        self.nodes.extend(nodes)
+        self._mark_modified()
+
+    def bulk_add_edges(self, edges: Iterable[GenericEdge]) -> None:
+        """
+        Add many edges to the graph, bumping the version once.
+
+        Args:
+            edges (Iterable[GenericEdge]): The edges to add.
+        """
+        edges = list(edges)
+        for edge in edges:
+            self._index_edge(edge)
+        self.edges.extend(edges)
+        self._mark_modified()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the graph to a plain dictionary for serialization.
+        Equivalent to model_dump() but without copying every properties dict.
+
+        Returns:
+            Dict[str, Any]: The graph as a dictionary of nodes, edges and metadata.
+        """
+        return {
+            "nodes": [node.to_dict() for node in self.nodes],
+            "edges": [edge.to_dict() for edge in self.edges],
+            "metadata": self.metadata,
+        }
+
+    def has_node(self, node_id: str) -> bool:
+        """
+        Check whether a node with the given ID exists in the graph.
+
+        Args:
+            node_id (str): The ID of the node to check.
+        Returns:
+            bool: True if the node exists, otherwise False.
+        """
+        return node_id in self._node_index
 
     def get_node_by_id(self, node_id: str) -> Optional[GenericNode]:
         """
@@ -133,10 +290,7 @@ class GenericGraph(BaseModel):
         Returns:
             Optional[GenericNode]: The node if found, otherwise None.
         """
-        for node in self.nodes:
-            if node.id == node_id:
-                return node
-        return None
+        return self._node_index.get(node_id)
     
     def get_nodes_by_type(self, node_type: str) -> List[GenericNode]:
         """
@@ -147,7 +301,7 @@ class GenericGraph(BaseModel):
         Returns:
             List[GenericNode]: A list of nodes matching the specified type.
         """
-        return [node for node in self.nodes if node.type.lower() == node_type.lower()]
+        return list(self._nodes_by_type_lc.get(node_type.lower(), []))
     
     def get_edges_by_type(self, edge_type: str) -> List[GenericEdge]:
         """
@@ -158,7 +312,55 @@ class GenericGraph(BaseModel):
         Returns:
             List[GenericEdge]: A list of edges matching the specified type.
         """
-        return [edge for edge in self.edges if edge.type.lower() == edge_type.lower()]
+        return list(self._edges_by_type_lc.get(edge_type.lower(), []))
+    
+    def iter_nodes_by_type(self, node_type: str) -> Iterator[GenericNode]:
+        """
+        Iterate over nodes of a specific type without copying them into a list.
+        The graph must not be modified while iterating.
+
+        Args:
+            node_type (str): The type of nodes to iterate over.
+        Returns:
+            Iterator[GenericNode]: An iterator over nodes matching the specified type.
+        """
+        return iter(self._nodes_by_type_lc.get(node_type.lower(), ()))
+    
+    def iter_edges_by_type(self, edge_type: str) -> Iterator[GenericEdge]:
+        """
+        Iterate over edges of a specific type without copying them into a list.
+        The graph must not be modified while iterating.
+
+        Args:
+            edge_type (str): The type of edges to iterate over.
+        Returns:
+            Iterator[GenericEdge]: An iterator over edges matching the specified type.
+        """
+        return iter(self._edges_by_type_lc.get(edge_type.lower(), ()))
+    
+    def iter_edges_from_node(self, node_id: str) -> Iterator[GenericEdge]:
+        """
+        Iterate over edges originating from a specific node without copying them.
+        The graph must not be modified while iterating.
+
+        Args:
+            node_id (str): The ID of the source node.
+        Returns:
+            Iterator[GenericEdge]: An iterator over edges originating from the node.
+        """
+        return iter(self._out_edges.get(node_id, ()))
+    
+    def iter_edges_to_node(self, node_id: str) -> Iterator[GenericEdge]:
+        """
+        Iterate over edges pointing to a specific node without copying them.
+        The graph must not be modified while iterating.
+
+        Args:
+            node_id (str): The ID of the target node.
+        Returns:
+            Iterator[GenericEdge]: An iterator over edges pointing to the node.
+        """
+        return iter(self._in_edges.get(node_id, ()))
     
     def get_edges_from_node(self, node_id: str) -> List[GenericEdge]:
         """
@@ -169,7 +371,7 @@ class GenericGraph(BaseModel):
         Returns:
             List[GenericEdge]: A list of edges originating from the specified node.
         """
-        return [edge for edge in self.edges if edge.source == node_id]
+        return list(self._out_edges.get(node_id, []))
     
     def get_edges_to_node(self, node_id: str) -> List[GenericEdge]:
         """
@@ -180,7 +382,7 @@ class GenericGraph(BaseModel):
         Returns:
             List[GenericEdge]: A list of edges pointing to the specified node.
         """
-        return [edge for edge in self.edges if edge.target == node_id]
+        return list(self._in_edges.get(node_id, []))
     
     def get_neighbors(self, node_id: str, edge_type: Optional[str] = None) -> List[GenericNode]:
         """
@@ -191,18 +393,22 @@ class GenericGraph(BaseModel):
         Returns:
             List[GenericNode]: A list of neighboring nodes.
         """
+        node_index = self._node_index
+        edge_type_lc = edge_type.lower() if edge_type is not None else None
         neighbors = []
-        for edge in self.edges:
+        for edge in self._out_edges.get(node_id, []):
+            if edge_type_lc is None or edge.type.lower() == edge_type_lc:
+                neighbor = node_index.get(edge.target)
+                if neighbor:
+                    neighbors.append(neighbor)
+        for edge in self._in_edges.get(node_id, []):
+            # Self-loops were already counted as outgoing edges
             if edge.source == node_id:
-                if edge_type is None or edge.type.lower() == edge_type.lower():
-                    neighbor = self.get_node_by_id(edge.target)
-                    if neighbor:
-                        neighbors.append(neighbor)
-            elif edge.target == node_id:
-                if edge_type is None or edge.type.lower() == edge_type.lower():
-                    neighbor = self.get_node_by_id(edge.source)
-                    if neighbor:
-                        neighbors.append(neighbor)
+                continue
+            if edge_type_lc is None or edge.type.lower() == edge_type_lc:
+                neighbor = node_index.get(edge.source)
+                if neighbor:
+                    neighbors.append(neighbor)
         return neighbors
     
     def get_node_types(self) -> List[str]:
@@ -223,18 +429,25 @@ class GenericGraph(BaseModel):
         """
         return list(set(edge.type for edge in self.edges))
     
-    def get_stats(self) -> Dict[str, int]:
+    def get_stats(self) -> Dict[str, Any]:
         """
         Retrieve statistics about the graph.
 
         Returns:
-            Dict[str, int]: A dictionary containing the number of nodes and edges.
-        """
+            Dict[str, Any]: A dictionary containing the number of nodes and edges,
+                and per-type counts for nodes and edges.
+        """
+        # Type counts are cached until the graph is next modified
+        if self._stats_cache is None:
+            self._stats_cache = {
+                "node_types": dict(Counter(node.type for node in self.nodes)),
+                "edge_types": dict(Counter(edge.type for edge in self.edges)),
+            }
         return {
             "num_nodes": len(self.nodes),
             "num_edges": len(self.edges),
-            "node_types": {node_type: len(self.get_nodes_by_type(node_type)) for node_type in self.get_node_types()},
-            "edge_types": {edge_type: len(self.get_edges_by_type(edge_type)) for edge_type in self.get_edge_types()},
+            "node_types": dict(self._stats_cache["node_types"]),
+            "edge_types": dict(self._stats_cache["edge_types"]),
         }
     
 class GraphQueryResult(BaseModel):
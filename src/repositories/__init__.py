@@ -2,5 +2,6 @@
 Repositories module for data persistence.
 """
 from .json_graph_repository import JsonGraphRepository
+from .sqlite_extraction_cache import SqliteExtractionCache
 
-__all__ = ['JsonGraphRepository']
+__all__ = ['JsonGraphRepository', 'SqliteExtractionCache']
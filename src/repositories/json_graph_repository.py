@@ -3,8 +3,25 @@ JSON-based implementation of GraphRepository.
 """
 import json
 import os
+import stat
 import logging
-from typing import Optional, Dict, Any
+from itertools import chain
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, Any, Iterable, Iterator, List
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    import ijson
+    _HAS_IJSON = True
+except ImportError:
+    _HAS_IJSON = False
 
 from src.interfaces.graph_repository import GraphRepository
 from src.data.generic_models import GenericGraph, GenericNode, GenericEdge
@@ -12,6 +29,27 @@ from src.data.generic_models import GenericGraph, GenericNode, GenericEdge
 
 logger = logging.getLogger(__name__)
 
+# Buffer size for the stdlib-json write path
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Files smaller than this are parsed whole even by load_streaming()
+STREAMING_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# load_and_merge_multiple only parses in worker processes when there are at
+# least this many files totalling this many bytes, and more than one CPU;
+# below that, process startup and pickling cost more than they save
+PARALLEL_LOAD_MIN_FILES = 4
+PARALLEL_LOAD_MIN_BYTES = 4 * 1024 * 1024
+
+
+def _load_graph_dict(path: str, trusted: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Load a graph file in a worker process and return it as a plain dict,
+    which pickles more cheaply than pydantic models.
+    """
+    graph = JsonGraphRepository().load(path, trusted=trusted)
+    return graph.to_dict() if graph else None
+
 
 class JsonGraphRepository(GraphRepository):
     """
@@ -22,10 +60,14 @@ class JsonGraphRepository(GraphRepository):
         """
         Save a graph to a JSON file.
         
+        Uses orjson when available; orjson only supports 2-space indentation,
+        so any non-zero indent is written with 2 spaces on that path. Graphs
+        orjson cannot encode fall back to the stdlib json module.
+        
         Args:
             graph: The graph to save
             path: The path where to save the JSON file
-            indent: JSON indentation level (default: 2)
+            indent: JSON indentation level (default: 2, 0 for compact output)
             
         Returns:
             bool: True if successful, False otherwise
@@ -35,10 +77,24 @@ class JsonGraphRepository(GraphRepository):
             os.makedirs(os.path.dirname(path) if os.path.dirname(path) else '.', exist_ok=True)
             
             # Convert graph to dict
-            graph_dict = graph.model_dump()
+            graph_dict = graph.to_dict()
             
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(graph_dict, f, indent=indent, ensure_ascii=False)
+            # Serialize up front so the file is written in one call instead of many small writes
+            payload = None
+            if _HAS_ORJSON:
+                options = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+                try:
+                    payload = orjson.dumps(graph_dict, option=options)
+                except orjson.JSONEncodeError as e:
+                    # e.g. integers wider than 64 bits, which the stdlib encoder accepts
+                    logger.debug(f"orjson cannot encode graph ({e}), using json")
+            
+            if payload is not None:
+                self._write_bytes(path, payload)
+            else:
+                payload = json.dumps(graph_dict, indent=indent, ensure_ascii=False)
+                with open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                    f.write(payload)
 
             logger.info(f"Successfully saved graph to {path}")
             return True
@@ -47,12 +103,31 @@ class JsonGraphRepository(GraphRepository):
             logger.error(f"Error saving graph to {path}: {e}")
             return False
     
-    def load(self, path: str) -> Optional[GenericGraph]:
+    @staticmethod
+    def _write_bytes(path: str, payload: bytes) -> None:
+        """Write payload to path with raw os.write calls, bypassing Python's buffered IO."""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+    
+    def load(self, path: str, trusted: bool = False,
+             validate_edges: Optional[bool] = None) -> Optional[GenericGraph]:
         """
         Load a graph from a JSON file.
         
         Args:
             path: Path to the JSON file
+            trusted: Whether the file was produced by save() in this program.
+                Trusted files skip pydantic validation of nodes and edges;
+                leave False for user-supplied files.
+            validate_edges: Whether to drop edges whose endpoints are missing.
+                Defaults to validating only untrusted files, since save()
+                never writes dangling edges.
             
         Returns:
             Optional[GenericGraph]: The loaded graph, or None if failed
@@ -62,8 +137,12 @@ class JsonGraphRepository(GraphRepository):
             return None
         
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if _HAS_ORJSON:
+                with open(path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             
             # Validate basic structure
             if not isinstance(data, dict):
@@ -78,14 +157,7 @@ class JsonGraphRepository(GraphRepository):
                 logger.error("'nodes' field must be a list")
                 return None
             
-            for node_data in nodes_data:
-                try:
-                    node = GenericNode(**node_data)
-                    graph.add_node(node)
-                except Exception as e:
-                    logger.warning(f"Failed to load node {node_data.get('id', 'unknown')}: {e}")
-                    continue
-
+            self._load_nodes(graph, nodes_data, trusted)
             logger.info(f"Loaded {len(graph.nodes)} nodes from {path}")
 
             # Load edges
@@ -94,28 +166,15 @@ class JsonGraphRepository(GraphRepository):
                 logger.error("'edges' field must be a list")
                 return None
             
-            for edge_data in edges_data:
-                try:
-                    edge = GenericEdge(**edge_data)
-                    # Validate that source and target nodes exist
-                    if not graph.get_node_by_id(edge.source):
-                        logger.warning(f"Edge source node '{edge.source}' not found. Skipping edge.")
-                        continue
-                    if not graph.get_node_by_id(edge.target):
-                        logger.warning(f"Edge target node '{edge.target}' not found. Skipping edge.")
-                        continue
-                    graph.add_edge(edge)
-                except Exception as e:
-                    logger.warning(f"Failed to load edge: {e}")
-                    continue
-
+            self._load_edges(graph, edges_data, trusted, validate_edges)
             logger.info(f"Loaded {len(graph.edges)} edges from {path}")
 
             # Load metadata
             graph.metadata = data.get('metadata', {})
 
             logger.info(f"Successfully loaded graph from {path}")
-            logger.debug(f"Graph stats: {graph.get_stats()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Graph stats: %s", graph.get_stats())
             
             return graph
             
@@ -126,6 +185,90 @@ class JsonGraphRepository(GraphRepository):
             logger.error(f"Unexpected error loading graph from {path}: {e}")
             return None
     
+    def load_streaming(self, path: str, trusted: bool = False,
+                       validate_edges: Optional[bool] = None) -> Optional[GenericGraph]:
+        """
+        Load a graph from a JSON file, parsing nodes and edges one record at a time.
+        
+        Uses ijson so peak memory stays around one record instead of the whole
+        document. Falls back to load() when ijson is not installed or the file
+        is smaller than STREAMING_THRESHOLD_BYTES.
+        
+        Args:
+            path: Path to the JSON file
+            trusted: Whether the file was produced by save() (see load())
+            validate_edges: Whether to drop edges with missing endpoints (see load())
+            
+        Returns:
+            Optional[GenericGraph]: The loaded graph, or None if failed
+        """
+        if not self.exists(path):
+            logger.error(f"JSON file not found: {path}")
+            return None
+        
+        if not _HAS_IJSON or os.path.getsize(path) < STREAMING_THRESHOLD_BYTES:
+            return self.load(path, trusted=trusted, validate_edges=validate_edges)
+        
+        try:
+            graph = GenericGraph()
+            
+            # Each section is streamed in its own pass so records are never held together
+            with open(path, 'rb') as f:
+                self._load_nodes(graph, ijson.items(f, 'nodes.item', use_float=True), trusted)
+            logger.info(f"Loaded {len(graph.nodes)} nodes from {path}")
+            
+            with open(path, 'rb') as f:
+                self._load_edges(graph, ijson.items(f, 'edges.item', use_float=True), trusted, validate_edges)
+            logger.info(f"Loaded {len(graph.edges)} edges from {path}")
+            
+            with open(path, 'rb') as f:
+                graph.metadata = next(ijson.items(f, 'metadata', use_float=True), {})
+            
+            logger.info(f"Successfully streamed graph from {path}")
+            return graph
+            
+        except Exception as e:
+            logger.error(f"Error streaming graph from {path}: {e}")
+            return None
+    
+    def _load_nodes(self, graph: GenericGraph, nodes_data: Iterable[Dict[str, Any]], trusted: bool) -> None:
+        """Construct nodes from raw dicts and add them to graph, skipping invalid ones."""
+        # model_construct skips field validation for files we wrote ourselves
+        node_factory = GenericNode.model_construct if trusted else GenericNode
+        
+        for node_data in nodes_data:
+            try:
+                node = node_factory(**node_data)
+                graph.add_node(node)
+            except Exception as e:
+                logger.warning(f"Failed to load node {node_data.get('id', 'unknown')}: {e}")
+                continue
+    
+    def _load_edges(self, graph: GenericGraph, edges_data: Iterable[Dict[str, Any]], trusted: bool,
+                    validate_edges: Optional[bool] = None) -> None:
+        """Construct edges from raw dicts and add them to graph, optionally skipping dangling ones."""
+        edge_factory = GenericEdge.model_construct if trusted else GenericEdge
+        if validate_edges is None:
+            validate_edges = not trusted
+        
+        for edge_data in edges_data:
+            try:
+                edge = edge_factory(**edge_data)
+                if not validate_edges:
+                    graph.add_edge(edge)
+                    continue
+                # Validate that source and target nodes exist
+                if not graph.has_node(edge.source):
+                    logger.warning(f"Edge source node '{edge.source}' not found. Skipping edge.")
+                    continue
+                if not graph.has_node(edge.target):
+                    logger.warning(f"Edge target node '{edge.target}' not found. Skipping edge.")
+                    continue
+                graph.add_edge(edge)
+            except Exception as e:
+                logger.warning(f"Failed to load edge: {e}")
+                continue
+    
     def exists(self, path: str) -> bool:
         """
         Check if a graph file exists at the specified path.
@@ -136,11 +279,15 @@ class JsonGraphRepository(GraphRepository):
         Returns:
             bool: True if exists, False otherwise
         """
-        return os.path.exists(path) and os.path.isfile(path)
+        # A single stat() call instead of separate exists() and isfile() checks
+        try:
+            return stat.S_ISREG(os.stat(path).st_mode)
+        except (OSError, ValueError):
+            return False
     
     def merge(self, graph1: GenericGraph, graph2: GenericGraph) -> GenericGraph:
         """
-        Merge two graphs into one, avoiding duplicate nodes.
+        Merge two graphs into one, avoiding duplicate nodes and edges.
         
         Args:
             graph1: First graph
@@ -150,23 +297,11 @@ class JsonGraphRepository(GraphRepository):
             GenericGraph: The merged graph
         """
         merged = GenericGraph()
+        seen_edges = set()
         
-        # Track node IDs to avoid duplicates
-        node_ids = set()
-        
-        # Add nodes from both graphs
-        for graph in [graph1, graph2]:
-            for node in graph.nodes:
-                if node.id not in node_ids:
-                    merged.add_node(node)
-                    node_ids.add(node.id)
-        
-        # Add all edges (you might want to deduplicate these too)
-        for graph in [graph1, graph2]:
-            for edge in graph.edges:
-                # Only add edge if both nodes exist in merged graph
-                if edge.source in node_ids and edge.target in node_ids:
-                    merged.add_edge(edge)
+        # Add nodes from both graphs first so edges may cross between them
+        self._merge_nodes_into(merged, chain(graph1.nodes, graph2.nodes))
+        self._merge_edges_into(merged, chain(graph1.edges, graph2.edges), seen_edges)
         
         # Merge metadata
         merged.metadata = {**graph1.metadata, **graph2.metadata}
@@ -174,24 +309,106 @@ class JsonGraphRepository(GraphRepository):
         logger.info(f"Merged graphs: {len(merged.nodes)} nodes, {len(merged.edges)} edges")
         return merged
     
-    def load_and_merge_multiple(self, paths: list[str]) -> Optional[GenericGraph]:
+    def _merge_nodes_into(self, merged: GenericGraph, nodes: Iterable[GenericNode]) -> None:
+        """Add nodes to merged, skipping IDs already present."""
+        for node in nodes:
+            if not merged.has_node(node.id):
+                merged.add_node(node)
+    
+    def _merge_edges_into(self, merged: GenericGraph, edges: Iterable[GenericEdge], seen_edges: set) -> None:
+        """Add edges to merged, deduplicated by (source, target, type)."""
+        for edge in edges:
+            key = (edge.source, edge.target, edge.type)
+            if key in seen_edges:
+                continue
+            # Only add edge if both nodes exist in merged graph
+            if merged.has_node(edge.source) and merged.has_node(edge.target):
+                seen_edges.add(key)
+                merged.add_edge(edge)
+    
+    def load_and_merge_multiple(self, paths: list[str], max_workers: Optional[int] = None,
+                                trusted: bool = False) -> Optional[GenericGraph]:
         """
         Load multiple graph files and merge them into one.
         
+        Files are parsed in parallel worker processes when there are at least
+        PARALLEL_LOAD_MIN_FILES of them totalling PARALLEL_LOAD_MIN_BYTES and
+        more than one CPU is available, then folded into a single accumulator
+        in place rather than rebuilding a new merged graph for every file.
+        
         Args:
             paths: List of paths to JSON files
+            max_workers: Number of worker processes (default: CPU count, 1 disables parallelism)
+            trusted: Whether all files were produced by save() (see load())
             
         Returns:
             Optional[GenericGraph]: The merged graph, or None if all loads failed
         """
-        merged_graph = None
+        merged_graph = GenericGraph()
+        seen_edges = set()
+        loaded_count = 0
         
-        for path in paths:
-            graph = self.load(path)
+        for graph in self._iter_loaded_graphs(paths, max_workers, trusted):
             if graph:
-                if merged_graph is None:
-                    merged_graph = graph
-                else:
-                    merged_graph = self.merge(merged_graph, graph)
+                self._merge_nodes_into(merged_graph, graph.nodes)
+                self._merge_edges_into(merged_graph, graph.edges, seen_edges)
+                merged_graph.metadata.update(graph.metadata or {})
+                loaded_count += 1
+        
+        if loaded_count == 0:
+            return None
         
+        logger.info(f"Merged {loaded_count} graphs: {len(merged_graph.nodes)} nodes, {len(merged_graph.edges)} edges")
         return merged_graph
+    
+    def _iter_loaded_graphs(self, paths: List[str], max_workers: Optional[int] = None,
+                            trusted: bool = False) -> Iterator[Optional[GenericGraph]]:
+        """
+        Yield loaded graphs in input order, parsing files in worker processes when worthwhile.
+        """
+        if not self._worth_loading_in_parallel(paths, max_workers):
+            for path in paths:
+                yield self.load(path, trusted=trusted)
+            return
+        
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                graph_dicts = list(executor.map(_load_graph_dict, paths, [trusted] * len(paths)))
+        except (OSError, BrokenProcessPool, pickle.PicklingError) as e:
+            logger.warning(f"Parallel loading unavailable ({e}), loading sequentially")
+            for path in paths:
+                yield self.load(path, trusted=trusted)
+            return
+        
+        for graph_dict in graph_dicts:
+            yield self._graph_from_dict(graph_dict) if graph_dict else None
+    
+    @staticmethod
+    def _worth_loading_in_parallel(paths: List[str], max_workers: Optional[int]) -> bool:
+        """Check the file count, total size and CPU count against the parallel thresholds."""
+        if max_workers == 1 or len(paths) < PARALLEL_LOAD_MIN_FILES or (os.cpu_count() or 1) < 2:
+            return False
+        
+        total_bytes = 0
+        for path in paths:
+            try:
+                total_bytes += os.path.getsize(path)
+            except OSError:
+                # Missing files are reported by load()
+                continue
+            if total_bytes >= PARALLEL_LOAD_MIN_BYTES:
+                return True
+        return False
+    
+    def _graph_from_dict(self, graph_dict: Dict[str, Any]) -> GenericGraph:
+        """
+        Rebuild a graph from a dict produced by _load_graph_dict() in a worker.
+        
+        The worker's load() already applied the caller's validation policy, so
+        the records are not validated a second time here.
+        """
+        graph = GenericGraph()
+        self._load_nodes(graph, graph_dict['nodes'], trusted=True)
+        self._load_edges(graph, graph_dict['edges'], trusted=True, validate_edges=False)
+        graph.metadata = graph_dict.get('metadata') or {}
+        return graph
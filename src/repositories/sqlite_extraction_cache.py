@@ -0,0 +1,132 @@
+"""
+SQLite-backed cache of LLM extraction responses.
+"""
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteExtractionCache:
+    """
+    Exact-match cache mapping an extraction request to the model's JSON response.
+    
+    Keys hash the source text, context, model name, temperature and prompt
+    version, so a hit means the same request was answered before. Entries expire ttl_seconds
+    (if set) after they were stored, however often they are read, and the
+    least recently used ones are evicted beyond max_entries. Safe to share
+    between threads.
+    """
+    
+    def __init__(self, path: str, max_entries: int = 10000, ttl_seconds: Optional[float] = None):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: Path to the SQLite database file
+            max_entries: Maximum number of cached responses kept
+            ttl_seconds: Age since set() after which an entry is ignored and removed (never if None)
+        """
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            # ts is the last access time, for LRU eviction; created_at is for the TTL
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS graphs "
+                "(key BLOB PRIMARY KEY, json TEXT NOT NULL, ts REAL NOT NULL, created_at REAL NOT NULL)"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(graphs)")}
+            if "created_at" not in columns:
+                # Older databases: entries of unknown age count as expired
+                self._conn.execute("ALTER TABLE graphs ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS graphs_ts ON graphs (ts)")
+    
+    @staticmethod
+    def make_key(source: str, context: Optional[str], model_name: str, temperature: float,
+                 prompt_version: str = "") -> bytes:
+        """
+        Build the cache key for an extraction request.
+        
+        Args:
+            source: The text to extract from
+            context: Optional additional context
+            model_name: Model used for the extraction
+            temperature: Sampling temperature used
+            prompt_version: Identifies the prompt wording, so prompt changes miss old entries
+        
+        Returns:
+            bytes: A 32-byte BLAKE2b digest
+        """
+        digest = hashlib.blake2b(digest_size=32)
+        for part in (source, context or "", model_name, repr(temperature), prompt_version):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.digest()
+    
+    def get(self, key: bytes) -> Optional[str]:
+        """
+        Get a cached response and mark it as recently used.
+        
+        Args:
+            key: Key from make_key()
+        
+        Returns:
+            Optional[str]: The cached JSON response, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT json, created_at FROM graphs WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            
+            response_json, created_at = row
+            with self._conn:
+                if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                    self._conn.execute("DELETE FROM graphs WHERE key = ?", (key,))
+                    return None
+                self._conn.execute("UPDATE graphs SET ts = ? WHERE key = ?", (now, key))
+            return response_json
+    
+    def set(self, key: bytes, response_json: str) -> None:
+        """
+        Store a response, evicting the least recently used entries over max_entries.
+        
+        Args:
+            key: Key from make_key()
+            response_json: The model's JSON response
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO graphs (key, json, ts, created_at) VALUES (?, ?, ?, ?)",
+                (key, response_json, now, now)
+            )
+            self._conn.execute(
+                "DELETE FROM graphs WHERE key IN "
+                "(SELECT key FROM graphs ORDER BY ts DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+    
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM graphs")
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,165 @@
+"""
+Micro-batching of concurrent text extractions into grouped LLM calls.
+"""
+import asyncio
+import logging
+from typing import List, Optional, Set, Tuple
+
+from src.data.generic_models import GenericGraph
+from src.services.text_extractor import TextExtractor
+
+
+logger = logging.getLogger(__name__)
+
+# A queued request: text, context and the future its caller awaits
+_PendingExtraction = Tuple[str, Optional[str], "asyncio.Future[GenericGraph]"]
+
+
+class ExtractionBatcher:
+    """
+    Coalesces concurrent extract() calls into grouped LLM requests.
+    
+    Requests are queued and a background worker drains up to max_batch of
+    them, waiting at most max_wait_ms after the first one arrives. Each group
+    is sent as one prompt via TextExtractor.aextract_group; if the grouped
+    response does not match the expected shape, the group is retried one text
+    at a time.
+    
+    Usage:
+        async with ExtractionBatcher(text_extractor) as batcher:
+            graph = await batcher.extract(text)
+    """
+    
+    def __init__(self, text_extractor: Optional[TextExtractor] = None,
+                 max_batch: int = 8, max_wait_ms: float = 50.0, temperature: float = 0.0):
+        """
+        Initialize the batcher.
+        
+        Args:
+            text_extractor: TextExtractor instance to use (creates new if None)
+            max_batch: Maximum number of texts sent in one LLM call
+            max_wait_ms: How long to wait for more texts after the first one
+            temperature: Sampling temperature for the LLM
+        """
+        self.text_extractor = text_extractor or TextExtractor()
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.temperature = temperature
+        self._queue: Optional["asyncio.Queue[_PendingExtraction]"] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._groups: Set[asyncio.Task] = set()
+    
+    async def __aenter__(self) -> "ExtractionBatcher":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+    
+    async def extract(self, source: str, context: Optional[str] = None) -> GenericGraph:
+        """
+        Extract a knowledge graph from text, sharing an LLM call with concurrent requests.
+        
+        Args:
+            source: The text to extract from
+            context: Optional additional context to guide extraction
+        
+        Returns:
+            GenericGraph: The extracted knowledge graph
+        
+        Raises:
+            ValueError: If source is invalid
+            Exception: If extraction fails
+        """
+        if not self.text_extractor.validate_source(source):
+            raise ValueError("Source must be a non-empty string")
+        
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((source, context, future))
+        return await future
+    
+    async def aclose(self) -> None:
+        """
+        Stop the worker after the groups already in flight finish.
+        
+        Requests that were queued or still being collected into a group fail
+        with RuntimeError instead of waiting forever.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        if self._queue is not None:
+            pending = []
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            self._fail_pending(pending)
+        if self._groups:
+            await asyncio.gather(*self._groups, return_exceptions=True)
+    
+    async def _run(self) -> None:
+        """Collect queued requests into groups and dispatch them."""
+        loop = asyncio.get_running_loop()
+        group: List[_PendingExtraction] = []
+        try:
+            while True:
+                group = [await self._queue.get()]
+                deadline = loop.time() + self.max_wait
+                while len(group) < self.max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        group.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                
+                # Keep collecting the next group while this one waits on the LLM
+                task = asyncio.create_task(self._process(group))
+                self._groups.add(task)
+                task.add_done_callback(self._groups.discard)
+                group = []
+        except asyncio.CancelledError:
+            # Requests taken off the queue but not yet dispatched
+            self._fail_pending(group)
+            raise
+    
+    @staticmethod
+    def _fail_pending(pending: List[_PendingExtraction]) -> None:
+        """Fail the futures of requests that will never be processed."""
+        for _, _, future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("ExtractionBatcher closed"))
+    
+    async def _process(self, group: List[_PendingExtraction]) -> None:
+        """Extract a group with one call, falling back to one call per text."""
+        if len(group) > 1:
+            try:
+                graphs = await self.text_extractor.aextract_group(
+                    [(source, context) for source, context, _ in group], self.temperature
+                )
+            except Exception as e:
+                logger.warning(f"Grouped extraction of {len(group)} texts failed ({e}); extracting individually")
+            else:
+                for (_, _, future), graph in zip(group, graphs):
+                    if not future.done():
+                        future.set_result(graph)
+                return
+        
+        results = await asyncio.gather(
+            *(self.text_extractor.aextract(source, context, self.temperature) for source, context, _ in group),
+            return_exceptions=True
+        )
+        for (_, _, future), result in zip(group, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
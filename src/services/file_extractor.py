@@ -2,7 +2,11 @@
 File-based extractor implementation.
 """
 import os
+import mmap
 import logging
+import copy
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, List
 
 from src.interfaces.base_extractor import BaseExtractor
@@ -12,6 +16,12 @@ from src.services.text_extractor import TextExtractor
 
 logger = logging.getLogger(__name__)
 
+# Files at least this large are decoded from a read-only mmap instead of read()
+MMAP_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+# Number of extraction results kept per FileExtractor
+DEFAULT_CACHE_SIZE = 256
+
 
 class FileExtractor(BaseExtractor):
     """
@@ -19,14 +29,26 @@ class FileExtractor(BaseExtractor):
     Reads the file and uses TextExtractor for graph extraction.
     """
     
-    def __init__(self, text_extractor: Optional[TextExtractor] = None):
+    def __init__(self, text_extractor: Optional[TextExtractor] = None,
+                 max_workers: int = 4, cache_size: int = DEFAULT_CACHE_SIZE):
         """
         Initialize the file extractor.
         
         Args:
             text_extractor: TextExtractor instance to use (creates new if None)
+            max_workers: Number of files extracted concurrently by extract_from_multiple
+            cache_size: Number of extraction results to keep, keyed by path,
+                modification time, size and context. 0 disables caching.
         """
         self.text_extractor = text_extractor or TextExtractor()
+        self.max_workers = max(1, max_workers)
+        self.cache_size = max(0, cache_size)
+        # Per-instance result cache
+        self._cached_extract = functools.lru_cache(maxsize=self.cache_size)(self._extract_uncached)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached extraction results."""
+        self._cached_extract.cache_clear()
     
     def validate_source(self, source: str) -> bool:
         """
@@ -61,14 +83,11 @@ class FileExtractor(BaseExtractor):
         logger.info(f"Extracting graph from file: {source}")
         
         try:
-            # Read file content
-            with open(source, 'r', encoding='utf-8') as f:
-                text = f.read()
-            
-            logger.info(f"Read {len(text)} characters from {source}")
-            
-            # Extract graph using text extractor
-            graph = self.text_extractor.extract(text, context)
+            # A changed file gets a new mtime/size and therefore a new cache entry
+            st = os.stat(source)
+            cached = self._cached_extract(os.path.abspath(source), st.st_mtime_ns, st.st_size, context)
+            # Hand out a private copy so callers cannot mutate the cached graph
+            graph = copy.deepcopy(cached)
             
             # Add file path to metadata
             if graph.metadata is None:
@@ -83,26 +102,104 @@ class FileExtractor(BaseExtractor):
             logger.error(f"Failed to extract from file {source}: {e}", exc_info=True)
             raise
     
-    def extract_from_multiple(self, file_paths: List[str], context: Optional[str] = None) -> List[GenericGraph]:
+    def _extract_uncached(self, abspath: str, mtime_ns: int, size: int,
+                          context: Optional[str]) -> GenericGraph:
         """
-        Extract graphs from multiple files.
+        Read a file and run the text extractor on it.
         
         Args:
-            file_paths: List of file paths to extract from
-            context: Optional additional context for all extractions
+            abspath: Absolute path of the file
+            mtime_ns: Modification time of the file, part of the cache key
+            size: Size of the file in bytes, part of the cache key
+            context: Optional additional context to guide extraction
             
         Returns:
-            List[GenericGraph]: List of extracted graphs
+            GenericGraph: The extracted knowledge graph
         """
-        graphs = []
+        # Read file content
+        text = self._read_text(abspath)
+        
+        logger.info(f"Read {len(text)} characters from {abspath}")
+        
+        # Extract graph using text extractor
+        graph = self.text_extractor.extract(text, context)
+        return graph
+    
+    def _read_text(self, source: str) -> str:
+        """
+        Read a UTF-8 text file.
+        
+        Large files are decoded straight from a read-only memory map, so the raw
+        bytes stay in the page cache instead of a second heap buffer.
+        
+        Args:
+            source: The file path to read
+            
+        Returns:
+            str: The decoded file content
+        """
+        if os.path.getsize(source) < MMAP_THRESHOLD_BYTES:
+            with open(source, 'r', encoding='utf-8', buffering=1 << 20) as f:
+                return f.read()
+        
+        with open(source, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, 'utf-8')
+        # Match text-mode universal newline handling
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+    
+    def _prefetch_files(self, file_paths: List[str]) -> None:
+        """
+        Ask the kernel to start reading all files ahead of time.
+        
+        Issues POSIX_FADV_WILLNEED for every file up front so the device sees
+        many outstanding reads instead of one at a time. No-op on platforms
+        without posix_fadvise.
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
         
         for file_path in file_paths:
             try:
-                graph = self.extract(file_path, context)
-                graphs.append(graph)
-            except Exception as e:
-                logger.error(f"Failed to extract from {file_path}: {e}")
+                fd = os.open(file_path, os.O_RDONLY)
+            except OSError:
+                # Missing files are reported by extract()
                 continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError as e:
+                logger.debug(f"posix_fadvise failed for {file_path}: {e}")
+            finally:
+                os.close(fd)
+    
+    def extract_from_multiple(self, file_paths: List[str], context: Optional[str] = None) -> List[GenericGraph]:
+        """
+        Extract graphs from multiple files concurrently.
+        
+        Args:
+            file_paths: List of file paths to extract from
+            context: Optional additional context for all extractions
+            
+        Returns:
+            List[GenericGraph]: List of extracted graphs, in input order
+        """
+        self._prefetch_files(file_paths)
+        
+        results: List[Optional[GenericGraph]] = [None] * len(file_paths)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            future_to_index = {
+                executor.submit(self.extract, file_path, context): index
+                for index, file_path in enumerate(file_paths)
+            }
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to extract from {file_paths[index]}: {e}")
+                    continue
         
+        graphs = [graph for graph in results if graph is not None]
         logger.info(f"Extracted {len(graphs)} graphs from {len(file_paths)} files")
         return graphs
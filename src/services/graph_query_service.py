@@ -2,13 +2,17 @@
 Graph Query Service - Handles querying operations on knowledge graphs.
 """
 import logging
-from typing import List, Optional, Any
+from collections.abc import Hashable
+from typing import Iterator, List, Optional, Any, Dict, Tuple
 
 from src.data.generic_models import GenericGraph, GenericNode, GenericEdge
 
 
 logger = logging.getLogger(__name__)
 
+# Separates fields in search blobs so a query cannot match across two fields
+_SEARCH_FIELD_SEPARATOR = "\x1f"
+
 
 class GraphQueryService:
     """
@@ -23,10 +27,94 @@ class GraphQueryService:
             graph: The graph to query. Can be set later via set_graph()
         """
         self.graph = graph or GenericGraph()
+        self._invalidate_caches()
     
     def set_graph(self, graph: GenericGraph) -> None:
         """Set the graph to query."""
         self.graph = graph
+        self._invalidate_caches()
+    
+    def _invalidate_caches(self) -> None:
+        """Drop lookup structures derived from the current graph."""
+        self._search_index: Optional[List[Tuple[GenericNode, str, str, Dict[str, str]]]] = None
+        self._search_index_version: Optional[int] = None
+        self._search_columns: Dict[str, List[Optional[str]]] = {}
+        self._search_id_type_column: List[str] = []
+        self._prop_index: Dict[str, Tuple[Dict[Any, List[GenericNode]], List[Tuple[GenericNode, Any]]]] = {}
+        self._prop_index_version: Optional[int] = None
+    
+    def _get_search_index(self) -> List[Tuple[GenericNode, str, str, Dict[str, str]]]:
+        """
+        Get per-node lowercase search blobs, rebuilt when the graph version
+        changes. Call graph.touch() after editing node properties.
+        
+        Each entry holds the node, a blob of its ID and type, a blob of ID, type
+        and all string property values, and the lowercased string properties by key.
+        """
+        if self._search_index is None or self._search_index_version != self.graph.version:
+            index = []
+            for node in self.graph.nodes:
+                props_lc = {
+                    key: value.lower()
+                    for key, value in node.properties.items()
+                    if isinstance(value, str)
+                }
+                id_type_blob = f"{node.id}{_SEARCH_FIELD_SEPARATOR}{node.type}".lower()
+                full_blob = _SEARCH_FIELD_SEPARATOR.join([id_type_blob, *props_lc.values()])
+                index.append((node, id_type_blob, full_blob, props_lc))
+            self._search_index = index
+            self._search_index_version = self.graph.version
+            self._search_columns = {}
+            self._search_id_type_column = [id_type_blob for _, id_type_blob, _, _ in index]
+        return self._search_index
+    
+    def _get_search_column(self, key: str) -> List[Optional[str]]:
+        """
+        Get one lowercased string property for every node, in search index order.
+        
+        Columns are built on first use and dropped with the search index. Values
+        that are missing or not strings are None.
+        """
+        search_index = self._get_search_index()
+        column = self._search_columns.get(key)
+        if column is None:
+            column = [props_lc.get(key) for _, _, _, props_lc in search_index]
+            self._search_columns[key] = column
+        return column
+    
+    def _get_property_index(
+        self, property_key: str
+    ) -> Tuple[Dict[Any, List[GenericNode]], List[Tuple[GenericNode, Any]]]:
+        """
+        Get the value index for one property key, built on first use.
+        
+        All property indexes are dropped when the graph version changes;
+        call graph.touch() after editing node properties.
+        
+        Returns a map from value (lowercased for strings) to matching nodes in
+        graph order, plus the (node, value) pairs whose values are unhashable.
+        """
+        if self._prop_index_version != self.graph.version:
+            self._prop_index = {}
+            self._prop_index_version = self.graph.version
+        
+        entry = self._prop_index.get(property_key)
+        if entry is None:
+            by_value: Dict[Any, List[GenericNode]] = {}
+            unhashable: List[Tuple[GenericNode, Any]] = []
+            for node in self.graph.nodes:
+                node_value = node.get_property(property_key)
+                if node_value is None:
+                    continue
+                if isinstance(node_value, str):
+                    by_value.setdefault(node_value.lower(), []).append(node)
+                elif isinstance(node_value, Hashable):
+                    by_value.setdefault(node_value, []).append(node)
+                else:
+                    unhashable.append((node, node_value))
+            entry = (by_value, unhashable)
+            self._prop_index[property_key] = entry
+        return entry
     
     def get_graph(self) -> GenericGraph:
         """Get the current graph."""
@@ -40,22 +128,23 @@ class GraphQueryService:
         """Get all nodes of a specific type."""
         return self.graph.get_nodes_by_type(node_type)
     
+    def iter_nodes_by_type(self, node_type: str) -> Iterator[GenericNode]:
+        """Iterate over nodes of a specific type without building a list."""
+        return self.graph.iter_nodes_by_type(node_type)
+    
     def get_nodes_by_property(self, property_key: str, property_value: Any) -> List[GenericNode]:
         """
         Find nodes that have a specific property value.
         Case-insensitive for string values.
         """
-        results = []
-        for node in self.graph.nodes:
-            node_value = node.get_property(property_key)
-            if node_value is not None:
-                # Case-insensitive comparison for strings
-                if isinstance(node_value, str) and isinstance(property_value, str):
-                    if node_value.lower() == property_value.lower():
-                        results.append(node)
-                elif node_value == property_value:
-                    results.append(node)
-        return results
+        by_value, unhashable = self._get_property_index(property_key)
+        
+        # Case-insensitive comparison for strings
+        if isinstance(property_value, str):
+            return list(by_value.get(property_value.lower(), []))
+        if isinstance(property_value, Hashable):
+            return list(by_value.get(property_value, []))
+        return [node for node, node_value in unhashable if node_value == property_value]
     
     def search_nodes(self, query: str, search_in_properties: Optional[List[str]] = None) -> List[GenericNode]:
         """
@@ -70,25 +159,40 @@ class GraphQueryService:
         Returns:
             List of matching nodes
         """
+        return list(self.iter_search_nodes(query, search_in_properties))
+    
+    def iter_search_nodes(self, query: str,
+                          search_in_properties: Optional[List[str]] = None) -> Iterator[GenericNode]:
+        """
+        Lazily search for nodes by text query, for callers that stop early.
+        
+        Args:
+            query: Search text (case-insensitive)
+            search_in_properties: List of property keys to search in. 
+                                 If None, searches in all properties.
+        
+        Returns:
+            Iterator over matching nodes, in graph order
+        """
         query_lower = query.lower()
-        results = []
-        
-        for node in self.graph.nodes:
-            # Search in ID and type
-            if query_lower in node.id.lower() or query_lower in node.type.lower():
-                results.append(node)
-                continue
-            
-            # Search in properties
-            for key, value in node.properties.items():
-                if search_in_properties and key not in search_in_properties:
-                    continue
-                
-                if isinstance(value, str) and query_lower in value.lower():
-                    results.append(node)
-                    break
+        search_index = self._get_search_index()
+        
+        # Unrestricted search is a single substring test per node
+        if not search_in_properties:
+            return (node for node, _, full_blob, _ in search_index if query_lower in full_blob)
+        
+        # Restricted search scans one flat column at a time (ID/type, then each
+        # requested property) and marks hits, instead of nested per-node lookups
+        columns = [self._search_id_type_column]
+        columns.extend(self._get_search_column(key) for key in dict.fromkeys(search_in_properties))
+        
+        matched = bytearray(len(search_index))
+        for column in columns:
+            for i, value_lc in enumerate(column):
+                if value_lc is not None and query_lower in value_lc:
+                    matched[i] = 1
         
-        return results
+        return (entry[0] for entry, hit in zip(search_index, matched) if hit)
     
     def get_neighbors(self, node_id: str, edge_type: Optional[str] = None, 
                      direction: str = 'both') -> List[GenericNode]:
@@ -104,34 +208,49 @@ class GraphQueryService:
             List of neighboring nodes
         """
         neighbors = []
+        append = neighbors.append
+        # Neighbors are resolved through get_node_by_id, so one ID maps to one node
+        seen_ids = set()
+        graph = self.graph
+        get_node = graph.get_node_by_id
+        edge_type_lc = edge_type.lower() if edge_type is not None else None
         
+        # Only the node's incident edges are visited, via the graph's adjacency lists
         if direction in ['outgoing', 'both']:
-            for edge in self.graph.edges:
-                if edge.source == node_id:
-                    if edge_type is None or edge.type.lower() == edge_type.lower():
-                        neighbor = self.graph.get_node_by_id(edge.target)
-                        if neighbor and neighbor not in neighbors:
-                            neighbors.append(neighbor)
+            for edge in graph.iter_edges_from_node(node_id):
+                if edge_type_lc is None or edge.type.lower() == edge_type_lc:
+                    neighbor = get_node(edge.target)
+                    if neighbor and neighbor.id not in seen_ids:
+                        seen_ids.add(neighbor.id)
+                        append(neighbor)
         
         if direction in ['incoming', 'both']:
-            for edge in self.graph.edges:
-                if edge.target == node_id:
-                    if edge_type is None or edge.type.lower() == edge_type.lower():
-                        neighbor = self.graph.get_node_by_id(edge.source)
-                        if neighbor and neighbor not in neighbors:
-                            neighbors.append(neighbor)
+            for edge in graph.iter_edges_to_node(node_id):
+                if edge_type_lc is None or edge.type.lower() == edge_type_lc:
+                    neighbor = get_node(edge.source)
+                    if neighbor and neighbor.id not in seen_ids:
+                        seen_ids.add(neighbor.id)
+                        append(neighbor)
         
         return neighbors
     
     def get_edges_between(self, source_id: str, target_id: str) -> List[GenericEdge]:
         """Get all edges between two nodes."""
-        return [edge for edge in self.graph.edges 
-                if edge.source == source_id and edge.target == target_id]
+        return list(self.iter_edges_between(source_id, target_id))
+    
+    def iter_edges_between(self, source_id: str, target_id: str) -> Iterator[GenericEdge]:
+        """Iterate over edges between two nodes without building a list."""
+        return (edge for edge in self.graph.iter_edges_from_node(source_id)
+                if edge.target == target_id)
     
     def get_edges_by_type(self, edge_type: str) -> List[GenericEdge]:
         """Get all edges of a specific type."""
         return self.graph.get_edges_by_type(edge_type)
     
+    def iter_edges_by_type(self, edge_type: str) -> Iterator[GenericEdge]:
+        """Iterate over edges of a specific type without building a list."""
+        return self.graph.iter_edges_by_type(edge_type)
+    
     def get_subgraph(self, node_ids: List[str], include_edges: bool = True) -> GenericGraph:
         """
         Extract a subgraph containing specified nodes.
@@ -145,16 +264,16 @@ class GraphQueryService:
         """
         subgraph = GenericGraph()
         
-        # Add nodes
+        # Add nodes, resolved through the graph's id index
         for node_id in node_ids:
             node = self.graph.get_node_by_id(node_id)
-            if node:
+            if node and not subgraph.has_node(node_id):
                 subgraph.add_node(node)
         
-        # Add edges if requested
+        # Add edges if requested; membership is checked against the subgraph's index
         if include_edges:
             for edge in self.graph.edges:
-                if edge.source in node_ids and edge.target in node_ids:
+                if subgraph.has_node(edge.source) and subgraph.has_node(edge.target):
                     subgraph.add_edge(edge)
         
         return subgraph
@@ -4,15 +4,128 @@ Graph Visualization Service - Creates interactive HTML visualizations.
 import os
 import html
 import logging
+import functools
+from collections import Counter
+from contextvars import ContextVar
 import networkx as nx
+import pyvis
+from jinja2 import ChoiceLoader, DictLoader, Environment, FileSystemLoader
 from pyvis.network import Network
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from src.data.generic_models import GenericGraph, GenericNode, GenericEdge
 
 
 logger = logging.getLogger(__name__)
 
+# pyvis template rendered by Network.generate_html()
+_PYVIS_TEMPLATE_NAME = "template.html"
+
+# HTML emitted right after <body> by the shared template, set per render
+_PRE_BODY_HTML: ContextVar[str] = ContextVar("pre_body_html", default="")
+
+
+@functools.lru_cache(maxsize=8192)
+def _escape_text(text_str: str) -> str:
+    """Flatten newlines and HTML-escape a string; memoized for repeated values."""
+    return html.escape(text_str.replace('\n', ' ').replace('\r', ''))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pyvis_template_env() -> Environment:
+    """
+    Get a Jinja environment for pyvis's bundled templates, shared by all renders.
+    
+    Every Network builds its own Environment, so its template would otherwise be
+    read and compiled again on each render; a shared one compiles it once.
+    The main template also gets a hook after <body> that emits the current
+    value of _PRE_BODY_HTML, so the legend is rendered in the same pass.
+    """
+    template_dir = os.path.join(os.path.dirname(pyvis.__file__), "templates")
+    with open(os.path.join(template_dir, _PYVIS_TEMPLATE_NAME), 'r', encoding='utf-8') as f:
+        source = f.read()
+    
+    if "<body>" in source:
+        source = source.replace("<body>", "<body>{{ pre_body_html() }}", 1)
+    else:
+        logger.warning("Could not find <body> tag to insert legend")
+    
+    env = Environment(loader=ChoiceLoader([
+        DictLoader({_PYVIS_TEMPLATE_NAME: source}),
+        FileSystemLoader(template_dir),
+    ]))
+    env.globals['pre_body_html'] = _PRE_BODY_HTML.get
+    return env
+
+
+# Static vis.js options; braces are doubled for str.format, only physics and groups vary
+_NET_OPTIONS_TMPL = """
+            {{
+              "physics": {{
+                "enabled": {physics},
+                "barnesHut": {{
+                  "gravitationalConstant": -2000,
+                  "centralGravity": 0.3,
+                  "springLength": 95,
+                  "springConstant": 0.04,
+                  "damping": 0.3,
+                  "avoidOverlap": 0.1
+                }},
+                "maxVelocity": 50,
+                "minVelocity": 0.1,
+                "solver": "barnesHut"
+              }},
+              "interaction": {{
+                "hover": true,
+                "navigationButtons": true,
+                "zoomView": true,
+                "dragView": true
+              }},
+              "nodes": {{
+                "font": {{
+                  "size": 12
+                }},
+                "color": {{ 
+                  "highlight": {{ 
+                    "border": "rgba(255,255,255,1)", 
+                    "background": "rgba(255,255,255,0.5)" 
+                  }},
+                  "hover": {{ 
+                    "border": "rgba(255,255,255,1)",
+                    "background": "rgba(255,255,255,0.5)"
+                  }}
+                }}
+              }},
+              "edges": {{
+                "font": {{
+                  "size": 10,
+                  "color": "white" 
+                }},
+                "arrows": {{
+                  "to": {{
+                    "enabled": true,
+                    "scaleFactor": 0.5
+                  }}
+                }},
+                "smooth": {{
+                    "enabled": true,
+                    "type": "dynamic"
+                }}
+              }},
+              "groups": {{
+                {groups}
+              }}
+            }}
+            """
+
+# Per-type legend entry; only color, type name and count vary
+_LEGEND_ITEM_TMPL = """
+                <div style="display: flex; align-items: center; margin-bottom: 8px;">
+                    <span style="display: inline-block; width: 20px; height: 20px; border-radius: 50%; background-color: {color}; margin-right: 10px; border: 1px solid #777;"></span>
+                    <span>{node_type} ({count})</span>
+                </div>
+            """
+
 
 class GraphVisualizationService:
     """
@@ -68,8 +181,7 @@ class GraphVisualizationService:
         """Clean and escape text for HTML display."""
         if text is None:
             return 'N/A'
-        text_str = str(text).replace('\n', ' ').replace('\r', '')
-        return html.escape(text_str)
+        return _escape_text(text if isinstance(text, str) else str(text))
     
     def _create_node_title(self, node: GenericNode) -> str:
         """Create a tooltip/title for a node showing all its properties."""
@@ -80,35 +192,53 @@ class GraphVisualizationService:
         ]
         
         # Add all properties
-        for key, value in node.properties.items():
-            lines.append(f"{key}: {self._clean_text(value)}")
+        clean = self._clean_text
+        lines.extend(f"{key}: {clean(value)}" for key, value in node.properties.items())
         
         return "\n".join(lines)
     
-    def _create_edge_title(self, edge: GenericEdge, graph: GenericGraph) -> str:
-        """Create a tooltip/title for an edge."""
-        source_node = graph.get_node_by_id(edge.source)
-        target_node = graph.get_node_by_id(edge.target)
+    def _create_edge_title(self,
+                           edge: GenericEdge,
+                           graph: GenericGraph,
+                           display_names: Optional[Dict[str, str]] = None) -> str:
+        """Create a tooltip/title for an edge.
         
-        source_name = source_node.get_display_name() if source_node else edge.source
-        target_name = target_node.get_display_name() if target_node else edge.target
+        Args:
+            edge: Edge to describe
+            graph: Graph the edge belongs to
+            display_names: Optional precomputed node ID -> display name map
+        """
+        if display_names is not None:
+            source_name = display_names.get(edge.source, edge.source)
+            target_name = display_names.get(edge.target, edge.target)
+        else:
+            source_node = graph.get_node_by_id(edge.source)
+            target_node = graph.get_node_by_id(edge.target)
+            
+            source_name = source_node.get_display_name() if source_node else edge.source
+            target_name = target_node.get_display_name() if target_node else edge.target
         
-        title = f"{self._clean_text(source_name)} --{edge.type}--> {self._clean_text(target_name)}"
+        lines = [f"{self._clean_text(source_name)} --{edge.type}--> {self._clean_text(target_name)}"]
         
         # Add edge properties if any
         if edge.properties:
-            title += "\n---"
+            lines.append("---")
             for key, value in edge.properties.items():
-                title += f"\n{key}: {self._clean_text(value)}"
+                lines.append(f"{key}: {self._clean_text(value)}")
         
-        return title
+        return "\n".join(lines)
     
-    def _calculate_node_size(self, node: GenericNode, graph: GenericGraph) -> int:
+    def _compute_degrees(self, graph: GenericGraph) -> Counter:
+        """Count incoming plus outgoing edges per node ID in a single pass."""
+        degree = Counter()
+        for edge in graph.edges:
+            degree[edge.source] += 1
+            degree[edge.target] += 1
+        return degree
+    
+    def _calculate_node_size(self, node: GenericNode, degree: Counter) -> int:
         """Calculate node size based on number of connections."""
-        # Count edges
-        incoming = len(graph.get_edges_to_node(node.id))
-        outgoing = len(graph.get_edges_from_node(node.id))
-        total_connections = incoming + outgoing
+        total_connections = degree[node.id]
         
         # Base size + size based on connections
         base_size = 15
@@ -116,6 +246,53 @@ class GraphVisualizationService:
         
         return base_size + connection_size
     
+    def _build_node_payload(self, nodes: List[GenericNode], degree: Counter) -> List[Tuple[str, dict]]:
+        """Build (node ID, attributes) tuples for NetworkX."""
+        create_node_title = self._create_node_title
+        calculate_node_size = self._calculate_node_size
+        node_color_map_get = self.type_to_color_map.get
+        return [
+            (
+                node.id,
+                {
+                    'label': node.get_display_name(),
+                    'group': node.type,
+                    'title': create_node_title(node),
+                    'size': calculate_node_size(node, degree),
+                    'color': node_color_map_get(node.type, '#CCCCCC'),
+                    'font': {'color': 'black'},
+                }
+            )
+            for node in nodes
+        ]
+    
+    def _build_edge_payload(self,
+                            edges: List[GenericEdge],
+                            graph: GenericGraph,
+                            valid_ids: FrozenSet[str],
+                            display_names: Dict[str, str]) -> List[Tuple[str, str, dict]]:
+        """Build (source, target, attributes) tuples for NetworkX, skipping dangling edges."""
+        edge_color_map_get = self.edge_type_to_color_map.get
+        create_edge_title = self._create_edge_title
+        edges_payload = []
+        append_edge = edges_payload.append
+        for edge in edges:
+            if edge.source in valid_ids and edge.target in valid_ids:
+                append_edge((
+                    edge.source,
+                    edge.target,
+                    {
+                        'title': create_edge_title(edge, graph, display_names),
+                        'label': edge.type,
+                        'color': edge_color_map_get(edge.type, 'gray'),
+                        'width': 2,
+                        'arrows': 'to' if edge.directed else '',
+                    }
+                ))
+            else:
+                logger.warning(f"Skipping edge {edge.source} -> {edge.target}: nodes not found")
+        return edges_payload
+    
     def create_html(self, 
                    graph: GenericGraph,
                    output_path: Optional[str] = None,
@@ -145,46 +322,25 @@ class GraphVisualizationService:
             # Assign colors to types
             self._assign_colors_to_types(graph)
             
+            # Precompute node degrees for sizing
+            degree = self._compute_degrees(graph)
+            
             # Create NetworkX graph
             G = nx.DiGraph()
             
-            # Add nodes to NetworkX
-            for node in graph.nodes:
-                node_id = node.id
-                label = node.get_display_name()
-                title = self._create_node_title(node)
-                size = self._calculate_node_size(node, graph)
-                color = self.type_to_color_map.get(node.type, '#CCCCCC')
-                
-                G.add_node(
-                    node_id,
-                    label=label,
-                    group=node.type,
-                    title=title,
-                    size=size,
-                    color=color,
-                    font={'color': 'black'}
-                )
+            # Add nodes to NetworkX in one bulk call
+            nodes_payload = self._build_node_payload(graph.nodes, degree)
+            G.add_nodes_from(nodes_payload)
 
             logger.info(f"Added {len(graph.nodes)} nodes to NetworkX graph")
 
-            # Add edges to NetworkX
-            for edge in graph.edges:
-                if G.has_node(edge.source) and G.has_node(edge.target):
-                    edge_title = self._create_edge_title(edge, graph)
-                    edge_color = self.edge_type_to_color_map.get(edge.type, 'gray')
-                    
-                    G.add_edge(
-                        edge.source,
-                        edge.target,
-                        title=edge_title,
-                        label=edge.type,
-                        color=edge_color,
-                        width=2,
-                        arrows='to' if edge.directed else ''
-                    )
-                else:
-                    logger.warning(f"Skipping edge {edge.source} -> {edge.target}: nodes not found")
+            # Add edges to NetworkX in one bulk call, skipping edges with missing endpoints
+            valid_ids = frozenset(node.id for node in graph.nodes)
+            # Display names per node ID; reversed so the first node with an ID wins,
+            # matching graph.get_node_by_id
+            display_names = {node.id: node.get_display_name() for node in reversed(graph.nodes)}
+            edges_payload = self._build_edge_payload(graph.edges, graph, valid_ids, display_names)
+            G.add_edges_from(edges_payload)
 
             logger.info(f"Added {len(graph.edges)} edges to NetworkX graph")
 
@@ -200,6 +356,9 @@ class GraphVisualizationService:
                 cdn_resources='remote'
             )
             
+            # Reuse the compiled pyvis template across renders
+            net.templateEnv = _get_pyvis_template_env()
+            
             # Load from NetworkX
             net.from_nx(G)
             
@@ -212,70 +371,14 @@ class GraphVisualizationService:
                 for node_type, color in self.type_to_color_map.items()
             ])
             
-            net.set_options(f"""
-            {{
-              "physics": {{
-                "enabled": {physics_config},
-                "barnesHut": {{
-                  "gravitationalConstant": -2000,
-                  "centralGravity": 0.3,
-                  "springLength": 95,
-                  "springConstant": 0.04,
-                  "damping": 0.3,
-                  "avoidOverlap": 0.1
-                }},
-                "maxVelocity": 50,
-                "minVelocity": 0.1,
-                "solver": "barnesHut"
-              }},
-              "interaction": {{
-                "hover": true,
-                "navigationButtons": true,
-                "zoomView": true,
-                "dragView": true
-              }},
-              "nodes": {{
-                "font": {{
-                  "size": 12
-                }},
-                "color": {{ 
-                  "highlight": {{ 
-                    "border": "rgba(255,255,255,1)", 
-                    "background": "rgba(255,255,255,0.5)" 
-                  }},
-                  "hover": {{ 
-                    "border": "rgba(255,255,255,1)",
-                    "background": "rgba(255,255,255,0.5)"
-                  }}
-                }}
-              }},
-              "edges": {{
-                "font": {{
-                  "size": 10,
-                  "color": "white" 
-                }},
-                "arrows": {{
-                  "to": {{
-                    "enabled": true,
-                    "scaleFactor": 0.5
-                  }}
-                }},
-                "smooth": {{
-                    "enabled": true,
-                    "type": "dynamic"
-                }}
-              }},
-              "groups": {{
-                {groups_config}
-              }}
-            }}
-            """)
-            
-            # Generate HTML
-            html_content = net.generate_html()
+            net.set_options(_NET_OPTIONS_TMPL.format(physics=physics_config, groups=groups_config))
             
-            # Add legend
-            html_content = self._add_legend_to_html(html_content, graph)
+            # Generate HTML with the legend rendered right after <body>
+            token = _PRE_BODY_HTML.set(self._build_legend_html(graph))
+            try:
+                html_content = net.generate_html()
+            finally:
+                _PRE_BODY_HTML.reset(token)
             
             # Validate HTML
             if not html_content or len(html_content) < 1000:
@@ -296,19 +399,20 @@ class GraphVisualizationService:
             logger.error(f"Error creating knowledge graph: {e}", exc_info=True)
             return f"<h3>Error generating knowledge graph: {e}</h3>"
     
-    def _add_legend_to_html(self, html_content: str, graph: GenericGraph) -> str:
-        """Add a draggable legend to the HTML showing node types and colors."""
+    def _build_legend_html(self, graph: GenericGraph) -> str:
+        """Build a draggable legend showing node types and colors."""
+        # Count every type in one pass (case-insensitive, like get_nodes_by_type)
+        type_counts = Counter(node.type.lower() for node in graph.nodes)
+        
         # Build legend items
-        legend_items = []
-        for node_type in sorted(self.type_to_color_map.keys()):
-            color = self.type_to_color_map[node_type]
-            count = len(graph.get_nodes_by_type(node_type))
-            legend_items.append(f"""
-                <div style="display: flex; align-items: center; margin-bottom: 8px;">
-                    <span style="display: inline-block; width: 20px; height: 20px; border-radius: 50%; background-color: {color}; margin-right: 10px; border: 1px solid #777;"></span>
-                    <span>{node_type} ({count})</span>
-                </div>
-            """)
+        legend_items = [
+            _LEGEND_ITEM_TMPL.format(
+                color=color,
+                node_type=node_type,
+                count=type_counts.get(node_type.lower(), 0)
+            )
+            for node_type, color in sorted(self.type_to_color_map.items())
+        ]
         
         legend_html = f"""
         <div id="kg-legend" style="position: absolute; top: 10px; left: 10px; background: rgba(50, 50, 50, 0.9); padding: 15px; border-radius: 8px; color: white; font-family: Arial, sans-serif; font-size: 14px; box-shadow: 0 4px 8px rgba(0,0,0,0.3); z-index: 1000; cursor: grab; max-width: 250px;">
@@ -357,11 +461,4 @@ class GraphVisualizationService:
         </script>
         """
         
-        # Insert legend after <body> tag
-        body_index = html_content.find("<body>")
-        if body_index != -1:
-            html_content = html_content[:body_index + len("<body>")] + legend_html + html_content[body_index + len("<body>"):]
-        else:
-            logger.warning("Could not find <body> tag to insert legend")
-        
-        return html_content
+        return legend_html
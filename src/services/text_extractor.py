@@ -2,34 +2,214 @@
 Text-based extractor implementation.
 """
 import json
+import time
+import hashlib
+import functools
 import logging
-from typing import Optional
+import httpx
+from typing import AbstractSet, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, TypeVar, Union
 from datetime import datetime
-from openai import OpenAI
+from openai import (
+    APIConnectionError, APITimeoutError, AsyncOpenAI, InternalServerError, OpenAI, RateLimitError
+)
+from pydantic import TypeAdapter, ValidationError
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    import ijson
+    _HAS_IJSON = True
+except ImportError:
+    _HAS_IJSON = False
 
 from src.interfaces.base_extractor import BaseExtractor
 from src.data.generic_models import GenericGraph, GenericNode, GenericEdge
-from src.core.config import app_config
+from src.core.config import get_app_config
+from src.repositories.sqlite_extraction_cache import SqliteExtractionCache
 
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Validate a whole nodes/edges array in one pydantic-core call
+_NODE_LIST_ADAPTER = TypeAdapter(List[GenericNode])
+_EDGE_LIST_ADAPTER = TypeAdapter(List[GenericEdge])
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson when available, else the stdlib."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _DeltaReader:
+    """
+    Minimal file-like view over streamed completion deltas, for ijson.
+    Optionally keeps the deltas so the full response can be cached.
+    """
+    
+    def __init__(self, deltas: Iterator[str], keep: Optional[List[str]] = None):
+        self._deltas = deltas
+        self._keep = keep
+    
+    def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream type with read(0); short reads are fine after that
+        if size == 0:
+            return b""
+        for delta in self._deltas:
+            if self._keep is not None:
+                self._keep.append(delta)
+            if delta:
+                return delta.encode("utf-8")
+        return b""
+
+
+def _json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON with orjson when available, else the stdlib."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Fully static instructions and output schema, sent as the system message so
+# the provider can cache the whole block; requests only vary the user message
+SYSTEM_PROMPT = """You are an expert at extracting structured information from unstructured text.
+
+Your task is to analyze the given text and extract:
+1. **Entities (Nodes)**: People, organizations, locations, or any significant items mentioned.
+2. **Relationships (Edges)**: Connections or relationships between the entities.
+
+IMPORTANT RULES:
+- Extract ALL meaningful entities, regardless of type
+- DO NOT limit to predefined categories - create appropriate types as needed
+- Each entity should have a unique ID, a type, and relevant properties
+- Relationships should be meaningful and directional
+- Use clear, descriptive relationship types (WORKS_AT, LOCATED_IN, etc.)
+- Include as much detail as possible in properties
+- Generate proper JSON format as specified below
+
+OUTPUT FORMAT:
+{
+    "nodes": [
+        {
+        "id": "unique_entity_id",
+        "type": "EntityType",
+        "properties": {
+            "name": "Entity Name",
+            "additional_property": "value"
+        }
+        }
+    ],
+    "edges": [
+        {
+        "source": "source_entity_id",
+        "target": "target_entity_id",
+        "type": "RELATIONSHIP_TYPE",
+        "properties": {
+            "detail": "value"
+        },
+        "directed": true
+        }
+    ]
+}
+
+Only return valid JSON, no additional text.
+"""
+
+# The system message is identical for every request: build it, and its
+# JSON encoding for batch files, once
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+_SYSTEM_MESSAGE_JSON = _json_dumps_bytes(_SYSTEM_MESSAGE)
+
+# User-message template for single-text extractions
+_USER_PROMPT_HEADER = "TEXT TO ANALYZE:\n"
+_CONTEXT_BLOCK_TEMPLATE = "\nADDITIONAL CONTEXT: {context}\n"
+
+# Digest of the prompt wording, part of cache keys so that editing the
+# prompts invalidates responses cached under the old ones
+PROMPT_VERSION = hashlib.blake2b(
+    "\0".join((SYSTEM_PROMPT, _USER_PROMPT_HEADER, _CONTEXT_BLOCK_TEMPLATE)).encode("utf-8"),
+    digest_size=16
+).hexdigest()
+
+
+# Connection pool and timeouts for the OpenAI HTTP clients
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0, write=10.0, pool=5.0)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.Client:
+    """
+    Process-wide HTTP client for the sync OpenAI clients, so extractors share
+    keep-alive connections instead of each opening its own pool.
+    """
+    return httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+
+@functools.lru_cache(maxsize=128)
+def _context_block(context: str) -> str:
+    """
+    Build the user-message block for an extraction context, reused across calls.
+    """
+    return _CONTEXT_BLOCK_TEMPLATE.format(context=context)
+
 
 class TextExtractor(BaseExtractor):
     """
     Extracts knowledge graphs from plain text using LLM.
     """
     
-    def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None):
+    # Streaming completion policy: abort a response when no chunk arrives within
+    # STREAM_CHUNK_TIMEOUT seconds, then retry with exponential backoff
+    STREAM_CHUNK_TIMEOUT = 30.0
+    MAX_ATTEMPTS = 3
+    RETRY_BACKOFF_SECONDS = 1.0
+    
+    # Batch API settings for extract_batch
+    BATCH_ENDPOINT = "/v1/chat/completions"
+    BATCH_COMPLETION_WINDOW = "24h"
+    BATCH_POLL_INTERVAL = 30.0
+    BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+    
+    def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None,
+                 client: Optional[OpenAI] = None, async_client: Optional[AsyncOpenAI] = None,
+                 cache: Optional[SqliteExtractionCache] = None):
         """
         Initialize the text extractor.
         
         Args:
             api_key: OpenAI API key (defaults to config)
             model_name: Model name to use (defaults to config)
+            client: Shared OpenAI client to reuse (creates one on the shared HTTP pool if None)
+            async_client: Shared AsyncOpenAI client for aextract (created on first use if None)
+            cache: Optional response cache; identical requests then skip the LLM call
         """
-        self.client = OpenAI(api_key=api_key or app_config.OPENAI_API_KEY)
-        self.model_name = model_name or app_config.LLM_MODEL_NAME_ANALYSIS
+        self.client = client or OpenAI(
+            api_key=api_key or get_app_config().OPENAI_API_KEY,
+            http_client=_shared_http_client()
+        )
+        self.model_name = model_name or get_app_config().LLM_MODEL_NAME_ANALYSIS
+        self._async_client = async_client
+        self.cache = cache
+    
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """AsyncOpenAI client using the same API key as the sync client."""
+        if self._async_client is None:
+            # An httpx.AsyncClient is tied to the event loop it first runs on,
+            # so the async pool is per extractor rather than process-wide
+            self._async_client = AsyncOpenAI(
+                api_key=self.client.api_key,
+                http_client=httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+            )
+        return self._async_client
     
     def validate_source(self, source: str) -> bool:
         """
@@ -65,121 +245,492 @@ class TextExtractor(BaseExtractor):
         logger.info(f"Extracting graph from text ({len(source)} characters)...")
         
         try:
+            # Reuse the response to an identical earlier request
+            cache_key, cached = self._lookup_cache(source, context, temperature)
+            if cached is not None:
+                return self._parse_graph(cached, source, context)
+            
             # Create the prompt
-            prompt = self._create_extraction_prompt(source, context)
+            messages = self._build_messages(self._create_extraction_prompt(source, context))
 
-            # Call the OpenAI API
-            response = self.client.chat.completions.create(
+            # Call the OpenAI API and parse the response
+            if _HAS_IJSON:
+                # Nodes and edges are built while the response is still streaming in
+                keep: Optional[List[str]] = [] if cache_key is not None else None
+                graph = self._with_retries(
+                    lambda: self._stream_graph(messages, temperature, source, context, keep)
+                )
+                response_content = "".join(keep) if keep is not None else None
+            else:
+                response_content = self._with_retries(lambda: self._stream_completion(messages, temperature))
+                graph = self._parse_graph(response_content, source, context)
+            
+            if response_content is not None:
+                self._store_cache(cache_key, response_content)
+            return graph
+            
+        except Exception as e:
+            logger.error(f"Extraction failed: {e}", exc_info=True)
+            raise
+    
+    async def aextract(self, source: str, context: Optional[str] = None,
+                       temperature: float = 0.0) -> GenericGraph:
+        """
+        Extract a knowledge graph from text without blocking the event loop.
+        
+        Args:
+            source: The text to extract from
+            context: Optional additional context to guide extraction
+            temperature: Sampling temperature for the LLM
+            
+        Returns:
+            GenericGraph: The extracted knowledge graph
+            
+        Raises:
+            ValueError: If source is invalid
+            Exception: If extraction fails
+        """
+        if not self.validate_source(source):
+            raise ValueError("Source must be a non-empty string")
+        
+        logger.info(f"Extracting graph from text ({len(source)} characters)...")
+        
+        try:
+            cache_key, cached = self._lookup_cache(source, context, temperature)
+            if cached is not None:
+                return self._parse_graph(cached, source, context)
+            
+            prompt = self._create_extraction_prompt(source, context)
+            
+            response = await self.async_client.chat.completions.create(
                 model=self.model_name,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=self._build_messages(prompt),
                 temperature=temperature,
                 response_format={"type": "json_object"}
             )
-
-            # Parse the response
-            response_content = response.choices[0].message.content
-
-            # Parse JSON content
-            extracted_data = json.loads(response_content)
-
-            # Create Graph
-            graph = GenericGraph()
-
-            # Add metadata
-            graph.metadata = {
-                "extraction_timestamp": datetime.utcnow().isoformat(),
-                "model_name": self.model_name,
-                "source_text_length": len(source),
-                "context_provided": context,
-                "extractor_type": "TextExtractor"
-            }
-
-            # Add nodes
-            nodes_data = extracted_data.get("nodes", [])
-            for node_data in nodes_data:
-                try:
-                    node = GenericNode(**node_data)
-                    graph.add_node(node)
-                except Exception as e:
-                    logger.warning(f"Error adding node: {e} - Data: {node_data}")
-            
-            # Add edges
-            edges_data = extracted_data.get("edges", [])
-            for edge_data in edges_data:
-                try:
-                    if "directed" not in edge_data:
-                        edge_data["directed"] = True
-                    edge = GenericEdge(**edge_data)
-                    # Validate that source and target nodes exist
-                    if graph.get_node_by_id(edge.source) and graph.get_node_by_id(edge.target):
-                        graph.add_edge(edge)
-                    else:
-                        logger.warning(f"Edge references non-existent nodes: {edge_data}")
-                except Exception as e:
-                    logger.warning(f"Error adding edge: {e} - Data: {edge_data}")
-            
-            stats = graph.get_stats()
-            logger.info(f"Extraction complete: {stats['num_nodes']} nodes, {stats['num_edges']} edges")
             
+            response_content = response.choices[0].message.content
+            graph = self._parse_graph(response_content, source, context)
+            self._store_cache(cache_key, response_content)
             return graph
             
         except Exception as e:
             logger.error(f"Extraction failed: {e}", exc_info=True)
             raise
     
-    def _create_extraction_prompt(self, text: str, context: Optional[str] = None) -> str:
+    def extract_batch(self, sources: List[str], contexts: Optional[List[Optional[str]]] = None,
+                      temperature: float = 0.0) -> List[Optional[GenericGraph]]:
         """
-        Create a prompt for extracting graph from text.
+        Extract graphs from many texts through the OpenAI Batch API.
+        
+        All requests are uploaded as one JSONL file and processed asynchronously
+        by OpenAI at a lower per-token price. This call blocks, polling every
+        BATCH_POLL_INTERVAL seconds, until the batch finishes (up to the 24h
+        completion window), so it suits bulk ingestion rather than interactive use.
+        
+        Args:
+            sources: The texts to extract from
+            contexts: Optional per-text context, same length as sources
+            temperature: Sampling temperature for the LLM
+            
+        Returns:
+            List[Optional[GenericGraph]]: One entry per source, in input order;
+                None where that request failed
+            
+        Raises:
+            ValueError: If a source is invalid or contexts has the wrong length
+            RuntimeError: If the batch does not complete
         """
-        prompt = f"""You are an expert at extracting structured information from unstructured text.
-
-Your task is to analyze the given text and extract:
-1. **Entities (Nodes)**: People, organizations, locations, or any significant items mentioned.
-2. **Relationships (Edges)**: Connections or relationships between the entities.
-
-IMPORTANT RULES:
-- Extract ALL meaningful entities, regardless of type
-- DO NOT limit to predefined categories - create appropriate types as needed
-- Each entity should have a unique ID, a type, and relevant properties
-- Relationships should be meaningful and directional
-- Use clear, descriptive relationship types (WORKS_AT, LOCATED_IN, etc.)
-- Include as much detail as possible in properties
-- Generate proper JSON format as specified below
+        if contexts is None:
+            contexts = [None] * len(sources)
+        if len(contexts) != len(sources):
+            raise ValueError("contexts must have the same length as sources")
+        for index, source in enumerate(sources):
+            if not self.validate_source(source):
+                raise ValueError(f"Source {index} must be a non-empty string")
+        if not sources:
+            return []
+        
+        logger.info(f"Submitting batch extraction for {len(sources)} texts...")
+        
+        # One chat completion request per line, matched back by custom_id.
+        # Only the id and user message vary, so the rest is encoded once and
+        # spliced in around them.
+        body_tail = _json_dumps_bytes({
+            "model": self.model_name,
+            "temperature": temperature,
+            "response_format": {"type": "json_object"}
+        })[1:]
+        lines = []
+        for index, (source, context) in enumerate(zip(sources, contexts)):
+            request_head = _json_dumps_bytes({
+                "custom_id": f"doc-{index}",
+                "method": "POST",
+                "url": self.BATCH_ENDPOINT
+            })[:-1]
+            user_message = _json_dumps_bytes({"role": "user", "content": self._create_extraction_prompt(source, context)})
+            lines.append(b"".join((
+                request_head, b',"body":{"messages":[', _SYSTEM_MESSAGE_JSON, b",", user_message, b"],", body_tail, b"}"
+            )))
+        payload = b"\n".join(lines)
+        
+        input_file = self.client.files.create(file=("extraction_batch.jsonl", payload), purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=self.BATCH_ENDPOINT,
+            completion_window=self.BATCH_COMPLETION_WINDOW
+        )
+        logger.info(f"Created batch {batch.id}")
+        
+        while batch.status not in self.BATCH_TERMINAL_STATUSES:
+            time.sleep(self.BATCH_POLL_INTERVAL)
+            batch = self.client.batches.retrieve(batch.id)
+            logger.debug(f"Batch {batch.id} status: {batch.status}")
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+        
+        graphs: List[Optional[GenericGraph]] = [None] * len(sources)
+        output = self.client.files.content(batch.output_file_id).content
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            result = _json_loads(line)
+            index = int(result["custom_id"].rsplit("-", 1)[1])
+            response = result.get("response") or {}
+            if result.get("error") or response.get("status_code") != 200:
+                logger.warning(f"Batch request {result['custom_id']} failed: {result.get('error') or response}")
+                continue
+            try:
+                content = response["body"]["choices"][0]["message"]["content"]
+                graphs[index] = self._parse_graph(content, sources[index], contexts[index])
+            except Exception as e:
+                logger.warning(f"Error parsing batch result {result['custom_id']}: {e}")
+        
+        logger.info(f"Batch {batch.id} complete: {sum(g is not None for g in graphs)}/{len(sources)} graphs extracted")
+        return graphs
+    
+    async def aextract_group(self, items: List[Tuple[str, Optional[str]]],
+                             temperature: float = 0.0) -> List[GenericGraph]:
+        """
+        Extract one graph per (text, context) item with a single LLM call.
+        
+        Suited to bursts of short texts, where one round trip and one copy of
+        the instructions replace one call per text.
+        
+        Args:
+            items: (text, context) pairs to extract from
+            temperature: Sampling temperature for the LLM
+            
+        Returns:
+            List[GenericGraph]: One graph per item, in input order
+            
+        Raises:
+            ValueError: If a text is invalid or the response does not contain
+                exactly one graph object per item
+        """
+        for text, _ in items:
+            if not self.validate_source(text):
+                raise ValueError("Source must be a non-empty string")
+        
+        logger.info(f"Extracting {len(items)} graphs in one request...")
+        
+        prompt = self._create_group_extraction_prompt(items)
+        response = await self.async_client.chat.completions.create(
+            model=self.model_name,
+            messages=self._build_messages(prompt),
+            temperature=temperature,
+            response_format={"type": "json_object"}
+        )
+        
+        graphs_data = _json_loads(response.choices[0].message.content).get("graphs")
+        if (not isinstance(graphs_data, list) or len(graphs_data) != len(items)
+                or not all(isinstance(graph_data, dict) for graph_data in graphs_data)):
+            raise ValueError(f"Expected {len(items)} graph objects in grouped response")
+        
+        return [
+            self._graph_from_data(graph_data, text, context)
+            for graph_data, (text, context) in zip(graphs_data, items)
+        ]
+    
+    def _with_retries(self, attempt_fn: Callable[[], _T]) -> _T:
+        """
+        Run a streaming completion attempt, retrying transient failures.
+        
+        Timeouts, connection errors, rate limits (429) and server errors (5xx)
+        are retried; the SDK's own retries are disabled for streams, so this
+        is the only retry layer. Each attempt opens a fresh stream, so partial
+        results from a failed attempt are discarded. Up to MAX_ATTEMPTS
+        attempts are made with exponential backoff.
+        """
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            try:
+                return attempt_fn()
+            
+            # Errors raised mid-stream surface as raw httpx transport errors
+            except (APITimeoutError, APIConnectionError, RateLimitError, InternalServerError,
+                    httpx.TransportError) as e:
+                if attempt == self.MAX_ATTEMPTS:
+                    raise
+                delay = self.RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1))
+                logger.warning(f"Completion attempt {attempt} failed ({e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+    
+    def _iter_completion_deltas(self, messages: List[Dict[str, str]], temperature: float) -> Iterator[str]:
+        """
+        Run a JSON-mode chat completion as a stream and yield its content deltas.
+        
+        The client timeout applies to each read, so a request that stops
+        producing tokens fails after STREAM_CHUNK_TIMEOUT seconds instead of
+        waiting for the SDK's overall timeout.
+        
+        Args:
+            messages: Chat messages to send
+            temperature: Sampling temperature for the LLM
+            
+        Yields:
+            str: Content deltas in arrival order
+        """
+        client = self.client.with_options(timeout=self.STREAM_CHUNK_TIMEOUT, max_retries=0)
+        stream = client.chat.completions.create(
+            model=self.model_name,
+            messages=messages,
+            temperature=temperature,
+            response_format={"type": "json_object"},
+            stream=True
+        )
+        with stream:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+    
+    def _stream_completion(self, messages: List[Dict[str, str]], temperature: float) -> str:
+        """
+        Run a streaming completion and return the full content.
+        """
+        return "".join(self._iter_completion_deltas(messages, temperature))
+    
+    def _stream_graph(self, messages: List[Dict[str, str]], temperature: float, source: str,
+                      context: Optional[str] = None, keep: Optional[List[str]] = None) -> GenericGraph:
+        """
+        Run a streaming completion and build the graph incrementally with ijson.
+        
+        Each node and edge object is constructed as soon as it has been
+        received, so the full response is never held as a nested dict. Edges
+        that arrive before the nodes array has ended are validated at the end.
+        
+        Args:
+            messages: Chat messages to send
+            temperature: Sampling temperature for the LLM
+            source: The text the graph is extracted from
+            context: Context passed to the extraction, recorded in metadata
+            keep: Optional list that receives the raw deltas, e.g. for caching
+            
+        Returns:
+            GenericGraph: The extracted knowledge graph
+        """
+        if keep is not None:
+            keep.clear()
+        reader = _DeltaReader(self._iter_completion_deltas(messages, temperature), keep)
+        
+        graph = self._new_graph(source, context)
+        deferred_edges: List[Dict[str, Any]] = []
+        node_ids: Optional[Set[str]] = None
+        builder = None
+        item_prefix = None
+        
+        for prefix, event, value in ijson.parse(reader, use_float=True):
+            if builder is None:
+                if event == 'start_map' and prefix in ('nodes.item', 'edges.item'):
+                    builder = ijson.ObjectBuilder()
+                    item_prefix = prefix
+                elif event == 'end_array' and prefix == 'nodes':
+                    node_ids = {node.id for node in graph.nodes}
+                    continue
+                else:
+                    continue
+            
+            builder.event(event, value)
+            if event == 'end_map' and prefix == item_prefix:
+                if item_prefix == 'nodes.item':
+                    self._add_node_data(graph, builder.value)
+                elif node_ids is not None:
+                    self._add_edge_data(graph, builder.value, node_ids)
+                else:
+                    deferred_edges.append(builder.value)
+                builder = None
+        
+        if deferred_edges:
+            if node_ids is None:
+                node_ids = {node.id for node in graph.nodes}
+            for edge_data in deferred_edges:
+                self._add_edge_data(graph, edge_data, node_ids)
+        
+        self._log_extraction_stats(graph)
+        return graph
+    
+    def _lookup_cache(self, source: str, context: Optional[str],
+                      temperature: float) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Look up a cached response for this request.
+        
+        Returns:
+            Tuple[Optional[bytes], Optional[str]]: The cache key (None without a
+                cache) and the cached response (None on a miss)
+        """
+        if self.cache is None:
+            return None, None
+        
+        cache_key = self.cache.make_key(source, context, self.model_name, temperature, PROMPT_VERSION)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached extraction response")
+        return cache_key, cached
+    
+    def _store_cache(self, cache_key: Optional[bytes], response_content: str) -> None:
+        """
+        Cache a response that parsed successfully.
+        """
+        if self.cache is not None and cache_key is not None:
+            self.cache.set(cache_key, response_content)
+    
+    def _build_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """
+        Build the chat messages for an extraction prompt.
+        """
+        return [_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
+    
+    def _parse_graph(self, response_content: str, source: str, context: Optional[str] = None) -> GenericGraph:
+        """
+        Build a graph from the LLM's JSON response.
+        
+        Args:
+            response_content: JSON text returned by the model
+            source: The text the graph was extracted from
+            context: Context passed to the extraction, recorded in metadata
+            
+        Returns:
+            GenericGraph: The extracted knowledge graph
+        """
+        # Parse JSON content
+        extracted_data: Dict[str, Any] = _json_loads(response_content)
+        return self._graph_from_data(extracted_data, source, context)
+    
+    def _graph_from_data(self, extracted_data: Dict[str, Any], source: str,
+                         context: Optional[str] = None) -> GenericGraph:
+        """
+        Build a graph from one decoded {"nodes": [...], "edges": [...]} object.
+        
+        Args:
+            extracted_data: Decoded graph object from the model
+            source: The text the graph was extracted from
+            context: Context passed to the extraction, recorded in metadata
+            
+        Returns:
+            GenericGraph: The extracted knowledge graph
+        """
+        # Create Graph
+        graph = self._new_graph(source, context)
 
-OUTPUT FORMAT:
-{{
-    "nodes": [
-        {{
-        "id": "unique_entity_id",
-        "type": "EntityType",
-        "properties": {{
-            "name": "Entity Name",
-            "additional_property": "value"
-        }}
-        }}
-    ],
-    "edges": [
-        {{
-        "source": "source_entity_id",
-        "target": "target_entity_id",
-        "type": "RELATIONSHIP_TYPE",
-        "properties": {{
-            "detail": "value"
-        }},
-        "directed": true
-        }}
-    ]
-}}
+        # Add nodes, validating the whole list at once and falling back
+        # to one item at a time to skip malformed entries
+        nodes_data = extracted_data.get("nodes", [])
+        try:
+            graph.bulk_add_nodes(_NODE_LIST_ADAPTER.validate_python(nodes_data))
+        except ValidationError:
+            for node_data in nodes_data:
+                self._add_node_data(graph, node_data)
+        
+        # Add edges, checking endpoints against the ids collected once
+        node_ids = {node.id for node in graph.nodes}
+        edges_data = extracted_data.get("edges", [])
+        try:
+            edges = _EDGE_LIST_ADAPTER.validate_python(edges_data)
+        except ValidationError:
+            for edge_data in edges_data:
+                self._add_edge_data(graph, edge_data, node_ids)
+        else:
+            valid_edges = []
+            for edge, edge_data in zip(edges, edges_data):
+                if edge.source in node_ids and edge.target in node_ids:
+                    valid_edges.append(edge)
+                else:
+                    logger.warning("Edge references non-existent nodes: %s", edge_data)
+            graph.bulk_add_edges(valid_edges)
+        
+        self._log_extraction_stats(graph)
+        return graph
+    
+    def _new_graph(self, source: str, context: Optional[str] = None) -> GenericGraph:
+        """
+        Create an empty graph carrying the extraction metadata.
+        """
+        graph = GenericGraph()
 
-TEXT TO ANALYZE:
-{text}
-"""
+        # Add metadata
+        graph.metadata = {
+            "extraction_timestamp": datetime.utcnow().isoformat(),
+            "model_name": self.model_name,
+            "source_text_length": len(source),
+            "context_provided": context,
+            "extractor_type": "TextExtractor"
+        }
+        return graph
+    
+    def _add_node_data(self, graph: GenericGraph, node_data: Dict[str, Any]) -> None:
+        """
+        Validate one node object from the model and add it, logging bad data.
+        """
+        try:
+            node = GenericNode(**node_data)
+            graph.add_node(node)
+        except Exception as e:
+            logger.warning("Error adding node: %s - Data: %s", e, node_data)
+    
+    def _add_edge_data(self, graph: GenericGraph, edge_data: Dict[str, Any], node_ids: AbstractSet[str]) -> None:
+        """
+        Validate one edge object from the model and add it if both endpoints are in node_ids.
+        """
+        try:
+            if "directed" not in edge_data:
+                edge_data["directed"] = True
+            edge = GenericEdge(**edge_data)
+            # Validate that source and target nodes exist
+            if edge.source in node_ids and edge.target in node_ids:
+                graph.add_edge(edge)
+            else:
+                logger.warning("Edge references non-existent nodes: %s", edge_data)
+        except Exception as e:
+            logger.warning("Error adding edge: %s - Data: %s", e, edge_data)
+    
+    def _log_extraction_stats(self, graph: GenericGraph) -> None:
+        """
+        Log node and edge counts of a finished extraction.
+        """
+        stats = graph.get_stats()
+        logger.info(f"Extraction complete: {stats['num_nodes']} nodes, {stats['num_edges']} edges")
+    
+    def _create_extraction_prompt(self, text: str, context: Optional[str] = None) -> str:
+        """
+        Create the user message for extracting a graph from text.
+        The instructions live in SYSTEM_PROMPT.
+        """
         if context:
-            prompt += f"\nADDITIONAL CONTEXT: {context}\n\n"
-        prompt += """
-Only return valid JSON, no additional text.
-"""
-        return prompt
+            return "".join((_USER_PROMPT_HEADER, text, "\n", _context_block(context)))
+        return "".join((_USER_PROMPT_HEADER, text, "\n"))
+    
+    def _create_group_extraction_prompt(self, items: List[Tuple[str, Optional[str]]]) -> str:
+        """
+        Create one user message asking for a separate graph per (text, context) item.
+        """
+        parts = [
+            f"You will be given {len(items)} separate texts. Extract a separate graph from each text.\n"
+            f'Return a single JSON object of the form {{"graphs": [...]}} containing exactly '
+            f"{len(items)} graph objects in the OUTPUT FORMAT, in the same order as the texts.\n\n"
+        ]
+        for index, (text, context) in enumerate(items, start=1):
+            parts.append(f"TEXT {index} TO ANALYZE:\n{text}\n")
+            if context:
+                parts.append(f"\nADDITIONAL CONTEXT FOR TEXT {index}: {context}\n")
+            parts.append("\n")
+        return "".join(parts)
@@ -2,18 +2,32 @@
 URL-based extractor implementation.
 """
 import os
+import re
+import hashlib
+import asyncio
 import logging
 import requests
-from bs4 import BeautifulSoup
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 from src.interfaces.base_extractor import BaseExtractor
 from src.data.generic_models import GenericGraph
 from src.services.text_extractor import TextExtractor
+from src.core.config import app_settings
 
 
 logger = logging.getLogger(__name__)
 
+# Splits extracted page text into phrases on line breaks and runs of spaces/tabs
+_TEXT_SPLIT_RE = re.compile(r"[ \t]{2,}|[\r\n]+")
+
+# Finds <meta charset=...> or http-equiv content charset in the document head
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?([A-Za-z0-9_.:-]+)""", re.IGNORECASE)
+META_CHARSET_SCAN_BYTES = 4096
+
 
 class URLExtractor(BaseExtractor):
     """
@@ -23,8 +37,17 @@ class URLExtractor(BaseExtractor):
     
     DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
     
+    # Connection pool and retry policy for sessions created by this class
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 20
+    MAX_RETRIES = 3
+    RETRY_BACKOFF_FACTOR = 0.3
+    RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+    
     def __init__(self, text_extractor: Optional[TextExtractor] = None, 
-                 timeout: int = 30, user_agent: Optional[str] = None):
+                 timeout: int = 30, user_agent: Optional[str] = None,
+                 session: Optional[requests.Session] = None,
+                 pool_maxsize: Optional[int] = None):
         """
         Initialize the URL extractor.
         
@@ -32,10 +55,65 @@ class URLExtractor(BaseExtractor):
             text_extractor: TextExtractor instance to use (creates new if None)
             timeout: Request timeout in seconds
             user_agent: Custom user agent string
+            session: Shared HTTP session for connection reuse (creates a pooled,
+                retrying session if None). A passed-in session is not closed by close().
+            pool_maxsize: Connections per host in the session's pool; sizes the created
+                session, and should match a passed-in session's pool (POOL_MAXSIZE if None)
         """
         self.text_extractor = text_extractor or TextExtractor()
         self.timeout = timeout
         self.user_agent = user_agent or self.DEFAULT_USER_AGENT
+        self.pool_maxsize = pool_maxsize or self.POOL_MAXSIZE
+        self._owns_session = session is None
+        self.session = session or self.create_session(self.user_agent, pool_maxsize=self.pool_maxsize)
+        # Sessions we did not create may carry a different User-Agent, so send ours per request
+        self._request_headers: Optional[Dict[str, str]] = (
+            None if self._owns_session else {"User-Agent": self.user_agent}
+        )
+    
+    @classmethod
+    def create_session(cls,
+                       user_agent: Optional[str] = None,
+                       pool_connections: Optional[int] = None,
+                       pool_maxsize: Optional[int] = None) -> requests.Session:
+        """
+        Create a keep-alive HTTP session with a connection pool and retries.
+        
+        Args:
+            user_agent: User-Agent header for all requests (default browser UA if None)
+            pool_connections: Number of per-host pools to cache
+            pool_maxsize: Maximum connections kept per host
+            
+        Returns:
+            requests.Session: Session with an HTTPAdapter mounted for http and https
+        """
+        session = requests.Session()
+        session.headers.update({"User-Agent": user_agent or cls.DEFAULT_USER_AGENT})
+        
+        retry = Retry(
+            total=cls.MAX_RETRIES,
+            backoff_factor=cls.RETRY_BACKOFF_FACTOR,
+            status_forcelist=cls.RETRY_STATUS_FORCELIST,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections or cls.POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize or cls.POOL_MAXSIZE,
+            max_retries=retry,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def close(self) -> None:
+        """Release pooled connections of the session created by this extractor."""
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self) -> "URLExtractor":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def validate_source(self, source: str) -> bool:
         """
@@ -73,22 +151,121 @@ class URLExtractor(BaseExtractor):
             # Fetch webpage content
             text = self._fetch_and_parse_url(source)
             
-            # Extract graph using text extractor
-            graph = self.text_extractor.extract(text, context)
+            return self._extract_from_page_text(source, text, context)
+            
+        except Exception as e:
+            logger.error(f"Failed to extract from URL {source}: {e}", exc_info=True)
+            raise
+    
+    async def aextract(self, source: str, context: Optional[str] = None) -> GenericGraph:
+        """
+        Extract a knowledge graph from a URL without blocking the event loop.
+        
+        The fetch and HTML parse run in a worker thread on the shared session;
+        the LLM call goes through the text extractor's async client.
+        
+        Args:
+            source: The URL to extract from
+            context: Optional additional context to guide extraction
             
-            # Add URL to metadata
-            if graph.metadata is None:
-                graph.metadata = {}
-            graph.metadata['source_url'] = source
-            graph.metadata['extractor_type'] = 'URLExtractor'
+        Returns:
+            GenericGraph: The extracted knowledge graph
             
-            logger.info(f"Successfully extracted graph from URL: {source}")
-            return graph
+        Raises:
+            ValueError: If source is not a valid URL
+            Exception: If extraction fails
+        """
+        if not self.validate_source(source):
+            raise ValueError("Source must be a valid URL starting with http:// or https://")
+        
+        logger.info(f"Extracting graph from URL: {source}")
+        
+        try:
+            text = await asyncio.to_thread(self._fetch_and_parse_url, source)
+            graph = await self.text_extractor.aextract(text, context)
+            return self._tag_graph(source, graph)
             
         except Exception as e:
             logger.error(f"Failed to extract from URL {source}: {e}", exc_info=True)
             raise
     
+    async def aextract_many(self, urls: List[str], context: Optional[str] = None,
+                            max_concurrency: int = app_settings.DEFAULT_MAX_WORKERS) -> List[GenericGraph]:
+        """
+        Extract graphs from many URLs concurrently.
+        
+        Args:
+            urls: URLs to extract from
+            context: Optional additional context for all extractions
+            max_concurrency: Maximum number of URLs in flight at once, to stay
+                within the HTTP pool and LLM rate limits
+            
+        Returns:
+            List[GenericGraph]: Graphs of the URLs that succeeded, in input order
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def bounded_extract(url: str) -> GenericGraph:
+            async with semaphore:
+                return await self.aextract(url, context)
+        
+        results = await asyncio.gather(*(bounded_extract(url) for url in urls), return_exceptions=True)
+        
+        graphs = []
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to extract from {url}: {result}")
+                continue
+            graphs.append(result)
+        
+        logger.info(f"Extracted {len(graphs)} graphs from {len(urls)} URLs")
+        return graphs
+    
+    def extract_and_save(self, url: str, output_dir: str, context: Optional[str] = None) -> Tuple[str, GenericGraph]:
+        """
+        Fetch a URL once, save its text to a file and extract a graph from it.
+        
+        Args:
+            url: The URL to extract from
+            output_dir: Directory to save the text file
+            context: Optional additional context to guide extraction
+            
+        Returns:
+            Tuple[str, GenericGraph]: Path to the saved text file and the extracted graph
+            
+        Raises:
+            ValueError: If url is not a valid URL
+            Exception: If fetching or extraction fails
+        """
+        if not self.validate_source(url):
+            raise ValueError("Source must be a valid URL starting with http:// or https://")
+        
+        text = self._fetch_and_parse_url(url)
+        text_path = self._save_text(url, text, output_dir)
+        graph = self._extract_from_page_text(url, text, context)
+        return text_path, graph
+    
+    def _extract_from_page_text(self, url: str, text: str, context: Optional[str] = None) -> GenericGraph:
+        """
+        Extract a graph from already fetched page text and tag it with the URL.
+        """
+        # Extract graph using text extractor
+        graph = self.text_extractor.extract(text, context)
+        return self._tag_graph(url, graph)
+    
+    def _tag_graph(self, url: str, graph: GenericGraph) -> GenericGraph:
+        """
+        Record the source URL and extractor in the graph metadata.
+        """
+        # Add URL to metadata
+        if graph.metadata is None:
+            graph.metadata = {}
+        graph.metadata['source_url'] = url
+        graph.metadata['extractor_type'] = 'URLExtractor'
+        
+        logger.info(f"Successfully extracted graph from URL: {url}")
+        return graph
+    
     def _fetch_and_parse_url(self, url: str) -> str:
         """
         Fetch webpage content and extract clean text.
@@ -104,28 +281,24 @@ class URLExtractor(BaseExtractor):
         """
         logger.info("Fetching webpage content...")
         
-        headers = {
-            "User-Agent": self.user_agent
-        }
-        
         try:
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            response = self.session.get(url, headers=self._request_headers, timeout=self.timeout)
             response.raise_for_status()
 
-            # Parse HTML and extract text
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Parse HTML in C
+            tree = LexborHTMLParser(self._decode_body(response))
 
             # Remove scripts and styles
-            for script in soup(["script", "style"]):
-                script.decompose()
+            tree.strip_tags(["script", "style"])
 
             # Get text
-            text = soup.get_text(separator='\n')
+            root = tree.root
+            text = root.text(separator='\n') if root is not None else ''
 
             # Clean up text
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = '\n'.join(chunk for chunk in chunks if chunk)
+            text = '\n'.join(
+                phrase for chunk in _TEXT_SPLIT_RE.split(text) if (phrase := chunk.strip())
+            )
             
             logger.info(f"Extracted {len(text)} characters of text from {url}")
             return text
@@ -134,6 +307,27 @@ class URLExtractor(BaseExtractor):
             logger.error(f"Failed to fetch URL {url}: {e}")
             raise
     
+    @staticmethod
+    def _decode_body(response: requests.Response) -> str:
+        """
+        Decode the response body using the Content-Type charset, then a
+        <meta> charset near the top of the document, then UTF-8.
+        """
+        content = response.content
+        charset = None
+        if 'charset' in response.headers.get('Content-Type', '').lower():
+            charset = requests.utils.get_encoding_from_headers(response.headers)
+        if not charset:
+            match = _META_CHARSET_RE.search(content, 0, META_CHARSET_SCAN_BYTES)
+            if match:
+                charset = match.group(1).decode('ascii')
+        
+        try:
+            return content.decode(charset or 'utf-8', errors='replace')
+        except LookupError:
+            logger.debug(f"Unknown charset {charset!r}, decoding as UTF-8")
+            return content.decode('utf-8', errors='replace')
+    
     def extract_and_save_text(self, url: str, output_dir: str) -> str:
         """
         Fetch URL and save the extracted text to a file.
@@ -146,17 +340,74 @@ class URLExtractor(BaseExtractor):
             str: Path to the saved text file
         """
         text = self._fetch_and_parse_url(url)
+        return self._save_text(url, text, output_dir)
+    
+    def extract_and_save_texts(self, urls: List[str], output_dir: str,
+                               max_workers: Optional[int] = None) -> List[str]:
+        """
+        Fetch many URLs concurrently and save each page's text to a file.
+        
+        Workers share the session, so fetches reuse its pooled keep-alive connections.
+        
+        Args:
+            urls: The URLs to fetch
+            output_dir: Directory to save the text files
+            max_workers: Number of concurrent fetches (defaults to pool_maxsize,
+                so workers never wait on or discard connections)
+            
+        Returns:
+            List[str]: Paths of the saved text files for the URLs that succeeded, in input order
+        """
+        max_workers = max(1, min(max_workers or self.pool_maxsize, len(urls) or 1))
+        
+        def fetch_and_save(url: str) -> Optional[str]:
+            try:
+                return self.extract_and_save_text(url, output_dir)
+            except Exception as e:
+                logger.error(f"Failed to save text from {url}: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch_and_save, urls))
+        
+        text_paths = [path for path in results if path is not None]
+        logger.info(f"Saved text of {len(text_paths)} of {len(urls)} URLs to {output_dir}")
+        return text_paths
+    
+    @staticmethod
+    def _url_file_stem(url: str) -> str:
+        """
+        Get the file name stem used for files saved from a URL.
+        
+        Args:
+            url: The source URL
+            
+        Returns:
+            str: Hex BLAKE2b digest of the URL
+        """
+        return hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _save_text(self, url: str, text: str, output_dir: str) -> str:
+        """
+        Save fetched page text to a file named after a hash of the URL.
+        
+        The URL itself is written next to it in a .url file with the same stem.
         
+        Returns:
+            str: Path to the saved text file
+        """
         # Ensure output directory exists
         os.makedirs(output_dir, exist_ok=True)
         
-        # Generate a filename based on URL
-        filename = url.replace("http://", "").replace("https://", "").replace("/", "_") + ".txt"
-        text_path = os.path.join(output_dir, filename)
+        # Hash the URL for a collision-free, filesystem-safe filename
+        stem = os.path.join(output_dir, self._url_file_stem(url))
+        text_path = stem + ".txt"
         
-        # Save text to file
+        # Save text to file, and the URL for reverse lookup
         with open(text_path, "w", encoding="utf-8") as f:
             f.write(text)
+        with open(stem + ".url", "w", encoding="utf-8") as f:
+            f.write(url)
         
         logger.info(f"Saved extracted text to {text_path}")
         return text_path
@@ -3,11 +3,12 @@ CLI tool for visualizing knowledge graphs.
 Refactored to use dependency injection and proper separation of concerns.
 """
 import os
+import hashlib
 import argparse
 import logging
+from importlib import metadata
+from typing import Optional
 
-from src.repositories.json_graph_repository import JsonGraphRepository
-from src.services.graph_visualization_service import GraphVisualizationService
 from src.core.config import app_settings
 from src.utils.logging_config import setup_logging
 
@@ -18,8 +19,20 @@ logger = logging.getLogger(__name__)
 class GraphVisualizationCLI:
     """CLI for knowledge graph visualization operations."""
     
+    # Suffix of the sidecar file recording which input produced an HTML file
+    HASH_SUFFIX = ".blake2b"
+    HASH_CHUNK_SIZE = 1 << 20
+    
+    # Hashed along with the pyvis version; bump whenever
+    # GraphVisualizationService output changes so existing HTML is rebuilt
+    RENDERER_VERSION = "1"
+    
     def __init__(self):
         """Initialize repository and visualization service with dependency injection."""
+        # Imported here so --help and argument errors do not pay for pyvis/networkx
+        from src.repositories.json_graph_repository import JsonGraphRepository
+        from src.services.graph_visualization_service import GraphVisualizationService
+        
         self.repository = JsonGraphRepository()
         self.viz_service = GraphVisualizationService()
     
@@ -29,9 +42,22 @@ class GraphVisualizationCLI:
         output_path: str,
         physics_enabled: bool = True,
         height: str = "800px",
-        width: str = "100%"
+        width: str = "100%",
+        force: bool = False
     ) -> None:
-        """Load and visualize a graph from JSON file."""
+        """
+        Load and visualize a graph from JSON file.
+        
+        The HTML is not regenerated when output_path was already built from
+        the same JSON content and options, unless force is set.
+        """
+        input_hash = self._input_hash(json_path, physics_enabled, height, width)
+        hash_path = output_path + self.HASH_SUFFIX
+        if (not force and input_hash is not None and os.path.exists(output_path)
+                and self._read_hash(hash_path) == input_hash):
+            logger.info(f"{output_path} is up to date with {json_path}, skipping visualization")
+            return
+        
         logger.info(f"Loading graph from {json_path}")
         
         # Load graph
@@ -57,9 +83,41 @@ class GraphVisualizationCLI:
         )
         
         if html_content and len(html_content) > 1000:
+            if input_hash is not None:
+                with open(hash_path, "w", encoding="utf-8") as f:
+                    f.write(input_hash)
             logger.info(f"Visualization saved to {output_path}")
         else:
             logger.error("Failed to create visualization")
+    
+    def _input_hash(self, json_path: str, physics_enabled: bool, height: str, width: str) -> Optional[str]:
+        """
+        Hash the graph file contents together with the rendering options and
+        renderer versions, or None if the file is unreadable.
+        """
+        # Read from package metadata so pyvis itself is not imported on a cache hit
+        try:
+            pyvis_version = metadata.version("pyvis")
+        except metadata.PackageNotFoundError:
+            pyvis_version = ""
+        header = f"{self.RENDERER_VERSION}\0{pyvis_version}\0{physics_enabled}\0{height}\0{width}\0"
+        digest = hashlib.blake2b(header.encode("utf-8"))
+        try:
+            with open(json_path, "rb") as f:
+                while chunk := f.read(self.HASH_CHUNK_SIZE):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _read_hash(hash_path: str) -> Optional[str]:
+        """Read a sidecar hash file, or None if it does not exist."""
+        try:
+            with open(hash_path, "r", encoding="utf-8") as f:
+                return f.read().strip()
+        except OSError:
+            return None
 
 
 def main():
@@ -94,7 +152,12 @@ def main():
         "--width",
         type=str,
         default=app_settings.DEFAULT_VIZ_WIDTH,
-        help=f"Width of the visualization (default: {app_settings.DEFAULT_VIZ_WIDTH})"
+        help="Width of the visualization (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate the HTML even if the graph and options are unchanged"
     )
     parser.add_argument(
         "--log_level",
@@ -118,7 +181,8 @@ def main():
             output_path=args.output_path,
             physics_enabled=not args.no_physics,
             height=args.height,
-            width=args.width
+            width=args.width,
+            force=args.force
         )
     except Exception as e:
         logger.error(f"Visualization failed: {e}")